@@ -0,0 +1,5 @@
+"""Benchmarks for the hot paths of Pavlova.
+
+Run them with ``python -m benchmarks``, and see ``python -m benchmarks --help``
+for saving and comparing against a baseline.
+"""
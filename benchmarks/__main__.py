@@ -0,0 +1,88 @@
+"Runs the benchmarks, optionally saving or comparing against a baseline"
+
+import argparse
+import json
+import sys
+import timeit
+from typing import Dict, List, Optional
+
+from benchmarks.workloads import WORKLOADS
+
+
+def run_workload(name: str, repeat: int) -> Dict[str, float]:
+    "Times a workload, returning its throughput and per record latency"
+    func, records = WORKLOADS[name]()
+    # The first run is discarded, as it includes compiling the plans.
+    func()
+    best = min(timeit.repeat(func, number=1, repeat=repeat))
+    return {
+        'records_per_second': records / best,
+        'latency_us': best / records * 1e6,
+    }
+
+
+def format_change(current: float, baseline: Optional[float]) -> str:
+    "Formats how much faster or slower the current run is than the baseline"
+    if not baseline:
+        return ''
+    return f'{(baseline - current) / baseline * 100:+.1f}%'
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    "Runs the benchmarks"
+    parser = argparse.ArgumentParser(prog='python -m benchmarks')
+    parser.add_argument(
+        'workloads', nargs='*', metavar='WORKLOAD',
+        help='The workloads to run, defaults to all of them. One of: '
+        + ', '.join(sorted(WORKLOADS)),
+    )
+    parser.add_argument(
+        '--repeat', type=int, default=5,
+        help='The number of times to run each workload, keeping the best',
+    )
+    parser.add_argument(
+        '--save', metavar='FILE', help='Save the results as a baseline',
+    )
+    parser.add_argument(
+        '--compare', metavar='FILE', help='Compare against a saved baseline',
+    )
+    parser.add_argument(
+        '--max-regression', type=float, default=None, metavar='PERCENT',
+        help='Exit with an error if any workload is this much slower than '
+        'the baseline',
+    )
+    args = parser.parse_args(argv)
+
+    unknown = set(args.workloads) - set(WORKLOADS)
+    if unknown:
+        parser.error(f'unknown workloads: {", ".join(sorted(unknown))}')
+
+    baseline: Dict[str, Dict[str, float]] = {}
+    if args.compare:
+        with open(args.compare) as baseline_file:
+            baseline = json.load(baseline_file)
+
+    results: Dict[str, Dict[str, float]] = {}
+    regressed = False
+    print(f'{"workload":<12} {"records/s":>14} {"latency (us)":>14} '
+          f'{"speedup":>8}')
+    for name in args.workloads or sorted(WORKLOADS):
+        result = results[name] = run_workload(name, args.repeat)
+        baseline_latency = baseline.get(name, {}).get('latency_us')
+        change = format_change(result['latency_us'], baseline_latency)
+        print(f'{name:<12} {result["records_per_second"]:>14,.0f} '
+              f'{result["latency_us"]:>14.2f} {change:>8}')
+
+        if baseline_latency and args.max_regression is not None:
+            slowdown = (result['latency_us'] / baseline_latency - 1) * 100
+            regressed = regressed or slowdown > args.max_regression
+
+    if args.save:
+        with open(args.save, 'w') as results_file:
+            json.dump(results, results_file, indent=2, sort_keys=True)
+
+    return 1 if regressed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
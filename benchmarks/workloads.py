@@ -0,0 +1,377 @@
+"The workloads that are benchmarked, each one parsing a batch of records"
+# pylint: disable=missing-docstring
+
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from decimal import Decimal
+from enum import Enum
+import json
+import os
+import subprocess
+import sys
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple
+
+from dataclasses import dataclass
+
+from pavlova import Pavlova
+
+# A workload returns the function to time, and the number of records that the
+# function parses each time it is called.
+Workload = Callable[[], Tuple[Callable[[], Any], int]]
+
+WORKLOADS: Dict[str, Workload] = {}
+
+
+def workload(func: Workload) -> Workload:
+    WORKLOADS[func.__name__] = func
+    return func
+
+
+class Currency(Enum):
+    AUD = 1
+    USD = 2
+    EUR = 3
+    GBP = 4
+    JPY = 5
+    INR = 6
+
+
+@dataclass
+class Flat:
+    id: int
+    name: str
+    enabled: bool
+    portion: float
+    price: Decimal
+
+
+@dataclass
+class Leaf:
+    key: str
+    value: int
+
+
+@dataclass
+class Branch:
+    name: str
+    leaf: Leaf
+
+
+@dataclass
+class Trunk:
+    name: str
+    branch: Branch
+
+
+@dataclass
+class Tree:
+    id: int
+    trunk: Trunk
+
+
+@dataclass
+class Series:
+    name: str
+    points: List[float]
+
+
+@dataclass
+class Attributes:
+    attributes: Dict[str, int]
+
+
+@dataclass
+class Sparse:
+    id: int
+    first: Optional[str] = None
+    second: Optional[int] = None
+    third: Optional[float] = None
+    fourth: Optional[bool] = None
+    fifth: Optional[Leaf] = None
+
+
+@dataclass
+class Payment:
+    amount: Decimal
+    currency: Currency
+
+
+@dataclass
+class Event:
+    created: datetime
+    updated: datetime
+    started: datetime
+    finished: datetime
+
+
+RECORDS = 1000
+
+
+def _parse(model_class: type,
+           records: List[Mapping[str, Any]]) -> Tuple[Callable[[], Any], int]:
+    pavlova = Pavlova()
+
+    def run() -> None:
+        for record in records:
+            pavlova.from_mapping(record, model_class)
+    return run, len(records)
+
+
+def _flat_records(count: int) -> List[Mapping[str, Any]]:
+    return [
+        {
+            'id': i,
+            'name': f'name {i}',
+            'enabled': 'yes',
+            'portion': i / 10,
+            'price': '10.01',
+        }
+        for i in range(count)
+    ]
+
+
+@workload
+def flat() -> Tuple[Callable[[], Any], int]:
+    return _parse(Flat, _flat_records(RECORDS))
+
+
+@workload
+def nested() -> Tuple[Callable[[], Any], int]:
+    return _parse(Tree, [
+        {
+            'id': i,
+            'trunk': {
+                'name': 'trunk',
+                'branch': {
+                    'name': 'branch',
+                    'leaf': {'key': 'leaf', 'value': i},
+                },
+            },
+        }
+        for i in range(RECORDS)
+    ])
+
+
+@workload
+def large_list() -> Tuple[Callable[[], Any], int]:
+    return _parse(Series, [
+        {'name': 'series', 'points': [float(i) for i in range(10000)]}
+        for _ in range(10)
+    ])
+
+
+@workload
+def large_list_lazy() -> Tuple[Callable[[], Any], int]:
+    # Only one field is read, so the list is never parsed
+    pavlova = Pavlova()
+    records = [
+        {'name': 'series', 'points': [float(i) for i in range(10000)]}
+        for _ in range(10)
+    ]
+
+    def run() -> None:
+        for record in records:
+            series = pavlova.lazy_from_mapping(record, Series)
+            assert series.name
+    return run, len(records)
+
+
+@workload
+def large_dict() -> Tuple[Callable[[], Any], int]:
+    return _parse(Attributes, [
+        {'attributes': {f'key {i}': i for i in range(10000)}}
+        for _ in range(10)
+    ])
+
+
+@workload
+def optional() -> Tuple[Callable[[], Any], int]:
+    return _parse(Sparse, [
+        {
+            'id': i,
+            'first': 'first' if i % 2 else None,
+            'second': i if i % 3 else None,
+            'fifth': {'key': 'leaf', 'value': i} if i % 5 else None,
+        }
+        for i in range(RECORDS)
+    ])
+
+
+@workload
+def enums() -> Tuple[Callable[[], Any], int]:
+    names = [c.name.lower() for c in Currency]
+    return _parse(Payment, [
+        {'amount': '10.50', 'currency': names[i % len(names)]}
+        for i in range(RECORDS)
+    ])
+
+
+@workload
+def datetimes() -> Tuple[Callable[[], Any], int]:
+    start = datetime(2018, 1, 1)
+    return _parse(Event, [
+        {
+            'created': (start + timedelta(minutes=i)).isoformat(),
+            'updated': (start + timedelta(hours=i)).isoformat() + 'Z',
+            'started': (start + timedelta(days=i)).timestamp(),
+            'finished': (start + timedelta(days=i)).strftime('%Y/%m/%d'),
+        }
+        for i in range(RECORDS)
+    ])
+
+
+@workload
+def flask_use() -> Tuple[Callable[[], Any], int]:
+    # pylint: disable=import-outside-toplevel
+    from flask import Flask
+    from pavlova.flask import FlaskPavlova
+
+    app = Flask(__name__)
+    pavlova = FlaskPavlova()
+
+    @app.route('/', methods=['POST'])
+    @pavlova.use(Flat)
+    def index(flat: Flat) -> str:  # pylint: disable=unused-variable
+        return str(flat.id)
+
+    client = app.test_client()
+    body = {
+        'id': 1,
+        'name': 'name',
+        'enabled': 'yes',
+        'portion': 0.1,
+        'price': '10.01',
+    }
+    requests = 100
+
+    def run() -> None:
+        for _ in range(requests):
+            client.post('/', json=body)
+    return run, requests
+
+
+@workload
+def flat_trusted() -> Tuple[Callable[[], Any], int]:
+    pavlova = Pavlova(trusted=True)
+    records = [
+        {
+            'id': i,
+            'name': f'name {i}',
+            'enabled': True,
+            'portion': i / 10,
+            'price': Decimal('10.01'),
+        }
+        for i in range(RECORDS)
+    ]
+
+    def run() -> None:
+        for record in records:
+            pavlova.from_mapping(record, Flat)
+    return run, len(records)
+
+
+@workload
+def flat_batch() -> Tuple[Callable[[], Any], int]:
+    pavlova = Pavlova()
+    records = _flat_records(RECORDS * 50)
+
+    def run() -> None:
+        pavlova.from_mappings(records, Flat)
+    return run, len(records)
+
+
+@workload
+def flat_json() -> Tuple[Callable[[], Any], int]:
+    pavlova = Pavlova()
+    documents = [
+        json.dumps(record).encode() for record in _flat_records(RECORDS)
+    ]
+
+    def run() -> None:
+        for document in documents:
+            pavlova.from_json(document, Flat)
+    return run, len(documents)
+
+
+@workload
+def flat_workers() -> Tuple[Callable[[], Any], int]:
+    pavlova = Pavlova()
+    workers = os.cpu_count() or 1
+    records = _flat_records(RECORDS * 50)
+
+    def run() -> None:
+        pavlova.from_mappings(records, Flat, workers=workers)
+    return run, len(records)
+
+
+def _thread_counts() -> List[int]:
+    "1, 2, 4 and so on, up to and including the number of CPUs"
+    cpus = os.cpu_count() or 1
+    counts = []
+    count = 1
+    while count < cpus:
+        counts.append(count)
+        count *= 2
+    counts.append(cpus)
+    return counts
+
+
+def _flat_threads(workers: int) -> Workload:
+    def flat_threads() -> Tuple[Callable[[], Any], int]:
+        # A single instance is shared by every thread, which only scales
+        # beyond one core on free-threaded builds of Python
+        pavlova = Pavlova()
+        records = _flat_records(RECORDS * 10)
+        chunks = [records[i::workers] for i in range(workers)]
+
+        def run() -> None:
+            # The executor is created for each run, so that its threads are
+            # always shut down. Starting them takes a negligible part of the
+            # time spent parsing.
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                list(executor.map(
+                    lambda chunk: pavlova.from_mappings(chunk, Flat), chunks,
+                ))
+        return run, len(records)
+
+    # The counts are padded, so that the workloads are listed in order
+    width = len(str(os.cpu_count() or 1))
+    flat_threads.__name__ = f'flat_threads_{workers:0{width}d}'
+    return flat_threads
+
+
+for _workers in _thread_counts():
+    workload(_flat_threads(_workers))
+
+
+@workload
+def import_pavlova() -> Tuple[Callable[[], Any], int]:
+    # Each run starts a new interpreter, as pavlova is only imported once
+    # per process. The time includes starting the interpreter, which is the
+    # same between runs, so a slower import still shows when comparing
+    # against a baseline.
+    command = [sys.executable, '-c', 'import pavlova']
+
+    def run() -> None:
+        subprocess.run(command, check=True)
+    return run, 1
+
+
+@workload
+def serialize() -> Tuple[Callable[[], Any], int]:
+    pavlova = Pavlova()
+    start = datetime(2018, 1, 1)
+    currencies = list(Currency)
+    records = [
+        (
+            Tree(i, Trunk('trunk', Branch('branch', Leaf('leaf', i)))),
+            Payment(Decimal('10.50'), currencies[i % len(currencies)]),
+            Event(start, start, start, start + timedelta(days=i)),
+        )
+        for i in range(RECORDS)
+    ]
+
+    def run() -> None:
+        for record in records:
+            pavlova.to_mappings(record)
+    return run, len(records)
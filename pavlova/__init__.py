@@ -1,24 +1,45 @@
 "Pavlova"
 
-#pylint: disable=no-name-in-module,ungrouped-imports
+#pylint: disable=no-name-in-module,ungrouped-imports,too-many-lines
 
+import array
+from contextlib import contextmanager
 import datetime
 from decimal import Decimal
 from enum import Enum
+import functools
 import inspect
+import itertools
+import threading
+from types import MappingProxyType
 import typing
 from typing import (
-    Any, Dict, Type, TypeVar, Union, Generic, List, Mapping, Optional, Tuple
+    Any, Callable, Dict, Type, TypeVar, Union, Generic, Iterable, Iterator,
+    List, Mapping, NamedTuple, Optional, Set, Tuple
 )
 import sys
 
 import dataclasses
 
-from pavlova.base import BasePavlova
-from pavlova.parsers import PavlovaParser
+from pavlova.base import BasePavlova, PavlovaParsingError
+from pavlova.cache import ResultCache
+import pavlova.cache
+from pavlova.decoders import JsonDecoder, JsonInput
+import pavlova.decoders
+from pavlova.parsers import DatetimeMode, PavlovaParser
+import pavlova.lazy
 import pavlova.parsers
+from pavlova.projection import UNSET, FieldSpec, Projection
+import pavlova.projection
+from pavlova.serializers import IdentitySerializer, PavlovaSerializer
+import pavlova.serializers
+from pavlova.streams import DEFAULT_BUFFER_SIZE, FileOrPath, iter_lines
+from pavlova.tracing import Tracer
 
 
+if typing.TYPE_CHECKING:
+    from concurrent.futures import Executor
+
 if sys.version_info < (3, 7):
     from typing import GenericMeta as GenericAlias  # type: ignore
 else:
@@ -26,31 +47,99 @@ else:
 
 T = TypeVar('T')  # pylint: disable=invalid-name
 
+# Set this in the metadata of a dataclass field to share equal values of the
+# field between records, e.g. field(metadata={INTERN: True})
+INTERN = 'pavlova.intern'
+
+
+class _FieldPlan(NamedTuple):
+    "The precomputed information needed to parse a single dataclass field"
+    name: str
+    type: Type
+    parser: Optional[PavlovaParser]
+    has_default: bool
+    # In trusted mode, values of exactly this type are used without parsing
+    exact_type: Optional[Type]
+
+
+# The precomputed information needed to serialize a single dataclass field.
+# The serializer is None if the value is used as is.
+_SerializerPlan = Tuple[Tuple[str, Type, Optional[PavlovaSerializer]], ...]
 
-class PavlovaParsingError(Exception):
-    """The exception that will be thrown if there is a ValueError or TypeError
-    encountered when parsing a mapping."""
-    def __init__(self,
-                 message: str,
-                 original_exception: Exception,
-                 path: Tuple[str, ...],
-                 expected_type: Type) -> None:
-        super().__init__(message)
 
-        self.original_exception = original_exception
-        self.path = path
-        self.expected_type = expected_type
+class _Snapshot(NamedTuple):
+    """The registered parsers and serializers, which are read only, and the
+    caches built from them. Registering a parser or serializer replaces the
+    whole snapshot, so each cache only ever holds what was resolved from the
+    registry that it is stored with, and threads can parse without locks."""
+    parsers: Mapping[Any, PavlovaParser]
+    serializers: Mapping[Any, PavlovaSerializer]
+    # The compiled field plans for each dataclass that has been parsed
+    plans: Dict[Type, Tuple[_FieldPlan, ...]]
+    # The parser resolved for each type annotation
+    resolved: Dict[Any, Optional[PavlovaParser]]
+    # The same caches for serializing
+    serializer_plans: Dict[Type, _SerializerPlan]
+    resolved_serializers: Dict[Any, Optional[PavlovaSerializer]]
+    # The plans for the fields selected with only or exclude, keyed by the
+    # dataclass, the projection, and whether it is excluded. Each is paired
+    # with the fields that weren't selected and have no default.
+    projections: Dict[
+        Tuple[Type, Projection, bool],
+        Tuple[Tuple[_FieldPlan, ...], Tuple[str, ...]],
+    ]
+
+
+def _new_snapshot(parsers: Mapping[Any, PavlovaParser],
+                  serializers: Mapping[Any, PavlovaSerializer]) -> _Snapshot:
+    "Returns a snapshot of a copy of the registries, with empty caches"
+    return _Snapshot(
+        MappingProxyType(dict(parsers)),
+        MappingProxyType(dict(serializers)),
+        {}, {}, {}, {}, {},
+    )
 
 
 class Pavlova(BasePavlova):
     "The main Pavlova class that handles parsing dictionaries"
+    # pylint: disable=too-many-instance-attributes
 
-    parsers: Dict[Any, PavlovaParser] = {}
+    # The number of values in a payload at which afrom_mapping and
+    # afrom_mappings parse it in async_executor, rather than blocking the event
+    # loop
+    async_offload_threshold: int = 1000
+    # The number of mappings that afrom_mappings parses at a time, before
+    # letting the event loop run other tasks
+    async_chunk_size: int = 100
+    # The maximum number of values shared between fields marked with INTERN
+    intern_maxsize: int = 100000
+    # The executor used for large payloads. If this is None, the event loop's
+    # default executor is used. A ProcessPoolExecutor requires the parsers and
+    # dataclasses to be picklable, the same as from_mappings with workers.
+    async_executor: Optional['Executor'] = None
+    # The decoder used by from_json and from_json_array. If this is None, the
+    # json module is used. Faster libraries can be picked with
+    # pavlova.decoders.get_decoder.
+    json_decoder: Optional[JsonDecoder] = None
 
-    def __init__(self) -> None:
-        self.parsers = {
+    def __init__(
+            self,
+            datetime_mode: DatetimeMode = DatetimeMode.FAST,
+            trusted: bool = False,
+    ) -> None:
+        """If trusted is set, values that already have exactly the type of
+        their field, and lists and dictionaries where every item already has
+        exactly the right type, are used without being parsed or copied. This
+        is intended for input that is known to be correctly typed, such as
+        from another internal service, and skips any validation that the
+        parsers would otherwise do for these values."""
+        self.trusted = trusted
+        parsers: Dict[Any, PavlovaParser] = {
+            array.array: pavlova.parsers.ArrayParser(self),
             bool: pavlova.parsers.BoolParser(self),
-            datetime.datetime: pavlova.parsers.DatetimeParser(self),
+            datetime.datetime: pavlova.parsers.DatetimeParser(
+                self, datetime_mode,
+            ),
             float: pavlova.parsers.FloatParser(self),
             int: pavlova.parsers.IntParser(self),
             str: pavlova.parsers.StringParser(self),
@@ -60,6 +149,42 @@ class Pavlova(BasePavlova):
             List: pavlova.parsers.ListParser(self),
             Union: pavlova.parsers.UnionParser(self),
         }
+        # Literal was added to typing in Python 3.8
+        if hasattr(typing, 'Literal'):
+            parsers[typing.Literal] = pavlova.parsers.LiteralParser(self)
+        self._dataclass_parser = pavlova.parsers.DataclassParser(self)
+        identity_serializer = pavlova.serializers.IdentitySerializer(self)
+        serializers: Dict[Any, PavlovaSerializer] = {
+            array.array: pavlova.serializers.ArraySerializer(self),
+            bool: identity_serializer,
+            datetime.datetime: pavlova.serializers.DatetimeSerializer(self),
+            float: identity_serializer,
+            int: identity_serializer,
+            str: identity_serializer,
+            Decimal: pavlova.serializers.DecimalSerializer(self),
+            Dict: pavlova.serializers.DictSerializer(self),
+            Enum: pavlova.serializers.EnumSerializer(self),
+            List: pavlova.serializers.ListSerializer(self),
+            Union: pavlova.serializers.UnionSerializer(self),
+        }
+        if hasattr(typing, 'Literal'):
+            serializers[typing.Literal] = identity_serializer
+        self._dataclass_serializer = pavlova.serializers.DataclassSerializer(
+            self,
+        )
+        self._snapshot = _new_snapshot(parsers, serializers)
+        # Held while registering, so that parsers registered at the same time
+        # by different threads aren't lost. Parsing never takes the lock.
+        self._register_lock = threading.Lock()
+        # The result caches added by cache_results, for each dataclass
+        self._result_caches: Dict[Type, ResultCache] = {}
+        # The values shared between fields marked with INTERN. This isn't
+        # reset with the other caches, so values are still shared after a
+        # parser is registered.
+        self._intern_table: Dict[Any, Any] = {}
+        # The tracer installed by trace. The parsers are only wrapped while a
+        # tracer is installed, so that there is no overhead otherwise.
+        self._tracer: Optional[Tracer] = None
 
     def register_parser(
             self,
@@ -70,99 +195,825 @@ class Pavlova(BasePavlova):
         the built in parsers. If you pass in a type that is already handled by
         Pavlova, it will overwrite the built in parser.
         """
-        self.parsers[parser_type] = parser
+        with self._register_lock:
+            snapshot = self._snapshot
+            self._snapshot = _new_snapshot(
+                {**snapshot.parsers, parser_type: parser},
+                snapshot.serializers,
+            )
+        # The cached instances may have been parsed by the previous parser
+        for result_cache in self._result_caches.values():
+            result_cache.clear()
+
+    def cache_results(self,
+                      model_class: Type,
+                      maxsize: int = 1024,
+                      ttl: Optional[float] = None) -> ResultCache:
+        """Caches the instances of model_class parsed by from_mapping, so
+        that parsing an equal mapping again returns the same instance
+        without parsing it. This also applies when model_class is nested in
+        another dataclass, and to from_mappings, iter_jsonl and the other
+        methods that parse many mappings. Up to maxsize instances are kept,
+        each for at most ttl seconds if it is set.
+
+        As the same instance is returned to every caller, model_class must
+        be a frozen dataclass, and a TypeError is raised if any of its
+        fields, including those of nested dataclasses, is a list,
+        dictionary, set, array or a dataclass that isn't frozen. Values of
+        other types, such as those of registered parsers, must not be
+        changed.
+
+        The returned ResultCache counts its hits and misses.
+        """
+        pavlova.cache.check_immutable(model_class)
+
+        result_cache = ResultCache(maxsize, ttl)
+        # The dictionary is replaced rather than changed, so that threads
+        # that are parsing never see it part way through being changed
+        self._result_caches = {
+            **self._result_caches, model_class: result_cache,
+        }
+        return result_cache
+
+    def register_serializer(
+            self,
+            serializer_type: Type[Any],
+            serializer: pavlova.serializers.PavlovaSerializer,
+    ) -> None:
+        """Adds a PavlovaSerializer for a particular type, which is used by
+        to_mapping. As with register_parser, this overwrites the built in
+        serializer for the type if there is one.
+        """
+        with self._register_lock:
+            snapshot = self._snapshot
+            self._snapshot = _new_snapshot(
+                snapshot.parsers,
+                {**snapshot.serializers, serializer_type: serializer},
+            )
+
+    @property
+    def parsers(self) -> Mapping[Any, PavlovaParser]:  # type: ignore
+        "A read only view of the registered parsers, keyed by their type"
+        return self._snapshot.parsers
+
+    @property
+    def serializers(self) -> Mapping[Any, PavlovaSerializer]:  # type: ignore
+        "A read only view of the registered serializers, keyed by their type"
+        return self._snapshot.serializers
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # The caches are rebuilt after unpickling, as they may reference
+        # classes that can't be pickled. Neither the registries, which are
+        # read only views, nor the lock can be pickled as they are.
+        state = self.__dict__.copy()
+        # An executor can't be pickled either. This instance is pickled to
+        # be sent to a ProcessPoolExecutor set as async_executor, and the
+        # copy in the worker process doesn't need it.
+        state.pop('async_executor', None)
+        state['_snapshot'] = (
+            dict(self._snapshot.parsers), dict(self._snapshot.serializers),
+        )
+        del state['_register_lock']
+        state['_tracer'] = None
+        state['_intern_table'] = {}
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._snapshot = _new_snapshot(*state['_snapshot'])
+        self._register_lock = threading.Lock()
+
+    def _reset_caches(self) -> None:
+        # The lock is held so that a parser registered at the same time
+        # isn't lost when the snapshot is replaced
+        with self._register_lock:
+            self._snapshot = self._snapshot._replace(
+                plans={}, resolved={}, projections={},
+            )
+
+    @contextmanager
+    def trace(self) -> Iterator[Tracer]:
+        """Records the number of calls to, and the time spent in, each parser
+        class and each dataclass field, while the context is active.
+
+            with pavlova.trace() as tracer:
+                pavlova.from_mapping(data, Model)
+            print(tracer.report())
+        """
+        previous_tracer = self._tracer
+        self._tracer = Tracer()
+        self._reset_caches()
+        try:
+            yield self._tracer
+        finally:
+            self._tracer = previous_tracer
+            self._reset_caches()
+
+    def warmup(self, *model_classes: Type) -> None:
+        """Resolves the parsers for the given dataclasses, and any types
+        nested within them, ahead of time. This means that the first time a
+        mapping is parsed, it will be as fast as any other time. Call this
+        before forking worker processes so that they share the work."""
+        seen: Set[Any] = set()
+        for model_class in model_classes:
+            if not dataclasses.is_dataclass(model_class):
+                raise TypeError("The root class must be a dataclass")
+            self._warmup_type(model_class, seen)
+
+    def _warmup_type(self, field_type: Type, seen: Set[Any]) -> None:
+        if field_type in seen:
+            return
+        seen.add(field_type)
+
+        parser = self._resolve_parser(field_type)
+        if parser is not None:
+            parser.warmup(field_type)
+
+        if dataclasses.is_dataclass(field_type):
+            for field in self._get_plan(field_type):
+                self._warmup_type(field.type, seen)
+
+        for sub_type in getattr(field_type, '__args__', None) or ():
+            self._warmup_type(sub_type, seen)
 
     def from_mapping(self,
                      input_mapping: Mapping[Any, Any],
                      model_class: Type[T],
-                     path: Optional[Tuple[str, ...]] = None) -> T:
+                     path: Optional[Tuple[str, ...]] = None,
+                     only: Optional[FieldSpec] = None,
+                     exclude: Optional[FieldSpec] = None) -> T:
         """Given a dictionary and a dataclass, return an instance of the
-        dataclass"""
+        dataclass.
+
+        Only some of the fields can be parsed by passing either only or
+        exclude, as a set of field names. These can also be a dictionary
+        that maps field names to the fields selected within them, for fields
+        that are dataclasses, or lists, dictionaries or Optionals of them,
+        such as {'id': ..., 'lines': {'sku'}}. Fields that aren't parsed are
+        given their default, or UNSET if they don't have one.
+        """
         if path is None:
             path = tuple()
 
-        if not dataclasses.is_dataclass(model_class):
-            raise TypeError("The root class must be a dataclass")
+        if only is not None or exclude is not None:
+            if only is not None and exclude is not None:
+                raise ValueError('Only one of only and exclude can be used')
+            return self._from_projection(
+                input_mapping,
+                model_class,
+                path,
+                pavlova.projection.normalize(
+                    exclude if only is None else only,  # type: ignore
+                ),
+                only is None,
+            )
 
-        data = dict()
-        for field in dataclasses.fields(model_class):
-            if field.name not in input_mapping:
+        if self._result_caches:
+            result_cache = self._result_caches.get(model_class)
+            if result_cache is not None:
+                return self._from_cache(
+                    input_mapping, model_class, path, result_cache,
+                )
+
+        return self._from_plan(
+            input_mapping, model_class, self._get_plan(model_class), path,
+        )
+
+    def lazy_from_mapping(self,
+                          input_mapping: Mapping[Any, Any],
+                          model_class: Type[T],
+                          path: Optional[Tuple[str, ...]] = None) -> T:
+        """The same as from_mapping, except that each field is only parsed
+        the first time it is read, which saves work when only a few fields
+        of a large mapping are used. Required fields are still checked
+        straight away.
+
+        The result is an instance of a subclass of model_class that is
+        generated for it. Its __init__ and __post_init__ aren't called, and
+        input_mapping is read as fields are accessed, so it mustn't be
+        changed afterwards. Nested dataclasses are lazy as well. Errors are
+        raised when a field is read, with the same path as from_mapping.
+        Pickling the instance parses every field, and unpickles it as an
+        instance of model_class.
+        """
+        if path is None:
+            path = tuple()
+
+        plan = self._get_plan(model_class)
+        for name, field_type, _, has_default, _ in plan:
+            if not has_default and name not in input_mapping:
+                raise _missing_field_error(name, field_type, path)
+
+        return pavlova.lazy.create(
+            self, input_mapping, model_class, plan, path,
+            self._dataclass_parser,
+        )
+
+    def from_mappings(self,
+                      input_mappings: Iterable[Mapping[Any, Any]],
+                      model_class: Type[T],
+                      workers: int = 1,
+                      chunk_size: int = 1000) -> List[T]:
+        """Given an iterable of dictionaries and a dataclass, return a list of
+        instances of the dataclass. If a mapping can't be parsed, its index is
+        prepended to the path of the PavlovaParsingError.
+
+        If workers is more than one, the mappings are split into chunks of
+        chunk_size, which are parsed in a pool of that many processes. This
+        Pavlova instance, including any registered parsers, is pickled and
+        sent with each chunk, so the parsers and model_class must be
+        picklable.
+        """
+        if workers <= 1:
+            return list(self.iter_from_mappings(input_mappings, model_class))
+
+        # Check the model class before starting any processes
+        self._get_plan(model_class)
+
+        # Importing concurrent.futures and multiprocessing takes a noticeable
+        # part of the time to start a process, so they are only imported once
+        # they are needed.
+        # pylint: disable=import-outside-toplevel
+        from concurrent.futures import ProcessPoolExecutor
+
+        iterator = iter(input_mappings)
+        chunks = iter(lambda: list(itertools.islice(iterator, chunk_size)), [])
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = executor.map(
+                _from_mappings_chunk,
+                itertools.repeat(self),
+                itertools.repeat(model_class),
+                itertools.count(0, chunk_size),
+                chunks,
+            )
+            return [record for chunk in results for record in chunk]
+
+    def iter_from_mappings(self,
+                           input_mappings: Iterable[Mapping[Any, Any]],
+                           model_class: Type[T]) -> Iterator[T]:
+        """The same as from_mappings, however the instances are lazily parsed
+        as the returned iterator is consumed."""
+        # Fetch the plan before returning the generator, so that an invalid
+        # model class is reported straight away.
+        return self._iter_from_plan(
+            input_mappings, model_class, self._get_plan(model_class),
+        )
+
+    def _iter_from_plan(self,
+                        input_mappings: Iterable[Mapping[Any, Any]],
+                        model_class: Type[T],
+                        plan: Tuple[_FieldPlan, ...],
+                        start: int = 0) -> Iterator[T]:
+        from_plan = self._get_record_parser(model_class)
+        path: Tuple[str, ...] = tuple()
+        index = start
+        try:
+            for index, input_mapping in enumerate(input_mappings, start):
+                yield from_plan(input_mapping, model_class, plan, path)
+        except PavlovaParsingError as exc:
+            exc.insert_path(path, f'[{index}]')
+            raise
+
+    def from_json(self, data: JsonInput, model_class: Type[T]) -> T:
+        """Given a JSON document, as bytes, a str or a memoryview of bytes,
+        and a dataclass, return an instance of the dataclass. Invalid JSON
+        raises a ValueError, and a TypeError is raised if the document isn't
+        an object.
+
+        In trusted mode, if the decoder supports it, such as
+        MsgspecDecoder(typed=True), the document is decoded straight into
+        model_class without building a dictionary. The decoder doesn't use
+        the registered parsers or INTERN, and only accepts values that
+        already have the type of their field, so other documents are
+        decoded and parsed as usual.
+        """
+        decoded, typed = self._decode_json(data, model_class)
+        if typed:
+            return decoded
+        return self.from_mapping(decoded, model_class)
+
+    def from_json_array(self,
+                        data: JsonInput,
+                        model_class: Type[T]) -> List[T]:
+        """The same as from_json, for a JSON document that is an array of
+        objects, returning a list of instances of the dataclass. If an
+        object can't be parsed, its index is prepended to the path of the
+        PavlovaParsingError, the same as from_mappings."""
+        decoder = self._get_json_decoder()
+        if self.trusted and model_class not in self._result_caches:
+            list_type: Any = List[model_class]  # type: ignore
+            instances = decoder.decode_typed(data, list_type)
+            if instances is not pavlova.decoders.UNTYPED:
+                return instances
+
+        input_mappings = decoder.decode(data)
+        if not isinstance(input_mappings, list):
+            raise TypeError('The JSON document must be an array')
+        for input_mapping in input_mappings:
+            if not isinstance(input_mapping, Mapping):
+                raise TypeError('The JSON array must only contain objects')
+        return self.from_mappings(input_mappings, model_class)
+
+    def _get_json_decoder(self) -> JsonDecoder:
+        decoder = self.json_decoder
+        if decoder is None:
+            decoder = pavlova.decoders.default_decoder()
+        return decoder
+
+    def _decode_json(self,
+                     data: JsonInput,
+                     model_class: Optional[Type]) -> Tuple[Any, bool]:
+        """Decodes a JSON object, returning it and False, or if it could be
+        decoded straight into model_class, the instance and True. Invalid
+        JSON raises a ValueError, and anything other than an object raises
+        a TypeError."""
+        decoder = self._get_json_decoder()
+        if (model_class is not None and self.trusted
+                and model_class not in self._result_caches):
+            instance = decoder.decode_typed(data, model_class)
+            if instance is not pavlova.decoders.UNTYPED:
+                return instance, True
+
+        input_mapping = decoder.decode(data)
+        if not isinstance(input_mapping, Mapping):
+            raise TypeError('The JSON document must be an object')
+        return input_mapping, False
+
+    async def afrom_mapping(self,
+                            input_mapping: Mapping[Any, Any],
+                            model_class: Type[T]) -> T:
+        """The same as from_mapping, for use with asyncio. Payloads with at
+        least async_offload_threshold values are parsed in async_executor, so
+        that the event loop isn't blocked."""
+        # asyncio is only imported by the async methods, as it is slow to
+        # import, and has already been imported by the time they are called.
+        import asyncio  # pylint: disable=import-outside-toplevel
+
+        if _payload_size(
+                input_mapping, self.async_offload_threshold,
+        ) < self.async_offload_threshold:
+            return self.from_mapping(input_mapping, model_class)
+
+        return await asyncio.get_event_loop().run_in_executor(
+            self.async_executor,
+            functools.partial(self.from_mapping, input_mapping, model_class),
+        )
+
+    async def afrom_mappings(self,
+                             input_mappings: Iterable[Mapping[Any, Any]],
+                             model_class: Type[T]) -> List[T]:
+        """The same as from_mappings, for use with asyncio. The mappings are
+        parsed async_chunk_size at a time, yielding to the event loop between
+        each chunk. Chunks with at least async_offload_threshold values are
+        parsed in async_executor."""
+        import asyncio  # pylint: disable=import-outside-toplevel
+
+        plan = self._get_plan(model_class)
+        loop = asyncio.get_event_loop()
+
+        results: List[T] = []
+        iterator = iter(input_mappings)
+        start = 0
+        while True:
+            chunk = list(itertools.islice(iterator, self.async_chunk_size))
+            if not chunk:
+                return results
+
+            if _payload_size(
+                    chunk, self.async_offload_threshold,
+            ) < self.async_offload_threshold:
+                results.extend(
+                    self._iter_from_plan(chunk, model_class, plan, start)
+                )
+                await asyncio.sleep(0)
+            else:
+                results.extend(await loop.run_in_executor(
+                    self.async_executor,
+                    functools.partial(
+                        _from_mappings_chunk, self, model_class, start, chunk,
+                    ),
+                ))
+            start += len(chunk)
+
+    def iter_jsonl(self,
+                   file_or_path: FileOrPath,
+                   model_class: Type[T],
+                   skip_invalid: bool = False,
+                   buffer_size: int = DEFAULT_BUFFER_SIZE,
+                   use_mmap: bool = False) -> Iterator[T]:
+        """Lazily parses each line of a JSON Lines file into an instance of
+        model_class, so that only one record is held in memory at a time.
+        Blank lines are ignored.
+
+        If a line can't be parsed, a PavlovaParsingError is raised with the
+        line number prepended to its path, such as ('line 10', 'date'),
+        unless skip_invalid is set, in which case the line is skipped.
+        """
+        # Fetch the plan before returning the generator, so that an invalid
+        # model class is reported straight away.
+        return self._iter_jsonl(
+            iter_lines(file_or_path, buffer_size, use_mmap),
+            model_class,
+            self._get_plan(model_class),
+            skip_invalid,
+        )
+
+    def _iter_jsonl(self,
+                    lines: Iterable[Union[str, bytes]],
+                    model_class: Type[T],
+                    plan: Tuple[_FieldPlan, ...],
+                    skip_invalid: bool) -> Iterator[T]:
+        from_plan = self._get_record_parser(model_class)
+        decode = self._get_json_decoder().decode
+        path: Tuple[str, ...] = tuple()
+        for line_number, line in enumerate(lines, 1):
+            if not line.strip():
+                continue
+
+            try:
+                try:
+                    input_mapping = decode(line)
+                    if not isinstance(input_mapping, dict):
+                        raise TypeError(
+                            f'Input value: {input_mapping} is not a dict'
+                        )
+                except (ValueError, TypeError) as exc:
+                    raise PavlovaParsingError(
+                        str(exc), exc, path, model_class,
+                    ) from exc
+                record = from_plan(input_mapping, model_class, plan, path)
+            except PavlovaParsingError as exc:
+                if skip_invalid:
+                    continue
+                exc.insert_path(path, f'line {line_number}')
+                raise
+
+            yield record
+
+    def _get_plan(self, model_class: Type) -> Tuple[_FieldPlan, ...]:
+        snapshot = self._snapshot
+        plan = snapshot.plans.get(model_class)
+        if plan is None:
+            plan = self._compile_plan(model_class, snapshot)
+        return plan
+
+    def _get_record_parser(self, model_class: Type) -> Callable[..., Any]:
+        """Returns _from_plan, or if the instances of model_class are
+        cached, a function with the same arguments that checks the cache
+        first, for the methods that parse many mappings"""
+        result_cache = self._result_caches.get(model_class)
+        if result_cache is None:
+            return self._from_plan
+
+        def from_cache(input_mapping: Mapping[Any, Any],
+                       model_class: Type[T],
+                       plan: Tuple[_FieldPlan, ...],
+                       path: Tuple[str, ...]) -> T:
+            # pylint: disable=unused-argument
+            return self._from_cache(
+                input_mapping, model_class, path, result_cache,  # type: ignore
+            )
+        return from_cache
+
+    def _from_cache(self,
+                    input_mapping: Mapping[Any, Any],
+                    model_class: Type[T],
+                    path: Tuple[str, ...],
+                    result_cache: ResultCache) -> T:
+        "Returns the cached instance for input_mapping, or parses it"
+        plan = self._get_plan(model_class)
+        try:
+            key = pavlova.cache.structural_key(input_mapping)
+        except TypeError:
+            # The mapping contains a value that can't be hashed
+            return self._from_plan(input_mapping, model_class, plan, path)
+
+        value = result_cache.get(key)
+        if value is pavlova.cache.MISSING:
+            value = self._from_plan(input_mapping, model_class, plan, path)
+            result_cache.put(key, value)
+        return value
+
+    def _from_projection(self,
+                         input_mapping: Mapping[Any, Any],
+                         model_class: Type[T],
+                         path: Tuple[str, ...],
+                         projection: Projection,
+                         exclude: bool) -> T:
+        "Parses the fields of model_class that are selected by projection"
+        snapshot = self._snapshot
+        key = (model_class, projection, exclude)
+        compiled = snapshot.projections.get(key)
+        if compiled is None:
+            compiled = self._compile_projection(
+                model_class, projection, exclude,
+            )
+            snapshot.projections[key] = compiled
+        plan, unset = compiled
+        return self._from_plan(input_mapping, model_class, plan, path, unset)
+
+    def _compile_projection(
+            self,
+            model_class: Type,
+            projection: Projection,
+            exclude: bool,
+    ) -> Tuple[Tuple[_FieldPlan, ...], Tuple[str, ...]]:
+        """Returns the plan for the fields of model_class selected by
+        projection, and the fields that aren't selected and have no
+        default"""
+        plan = self._get_plan(model_class)
+        pavlova.projection.check_fields(model_class, projection)
+        selected = dict(projection)
+
+        field_plans: List[_FieldPlan] = []
+        unset: List[str] = []
+        for field_plan, field in zip(plan, dataclasses.fields(model_class)):
+            name = field_plan.name
+            if exclude:
+                skipped = name in selected and selected[name] is None
+            else:
+                skipped = name not in selected
+            if skipped:
+                if (field.default is dataclasses.MISSING
+                        and field.default_factory  # type: ignore
+                        is dataclasses.MISSING):
+                    unset.append(name)
+                continue
+
+            nested = selected.get(name)
+            if nested is not None:
+                pavlova.projection.check_type(field_plan.type)
+                field_plan = field_plan._replace(
+                    parser=pavlova.projection.ProjectionParser(
+                        self, nested, exclude,
+                    ),
+                    exact_type=None,
+                )
+            field_plans.append(field_plan)
+        return tuple(field_plans), tuple(unset)
+
+    def _from_plan(self,
+                   input_mapping: Mapping[Any, Any],
+                   model_class: Type[T],
+                   plan: Tuple[_FieldPlan, ...],
+                   path: Tuple[str, ...],
+                   unset: Tuple[str, ...] = ()) -> T:
+        data = dict.fromkeys(unset, UNSET)
+        for name, field_type, parser, has_default, exact_type in plan:
+            if name not in input_mapping:
                 # Check if there is a default value set. If there isn't, raise
                 # an error, else continue parsing.
-                if not hasattr(model_class, field.name):
-                    raise PavlovaParsingError(
-                        f'Field: {field.name} missing',
-                        TypeError(),
-                        path + (field.name,),
-                        field.type,
-                    )
+                if not has_default:
+                    raise _missing_field_error(name, field_type, path)
                 continue
 
+            input_value = input_mapping[name]
+            # pylint: disable=unidiomatic-typecheck
+            if type(input_value) is exact_type:
+                data[name] = input_value
+                continue
+
+            # The path is only extended with the field name when there is an
+            # error, to avoid allocating a new path for every field.
             try:
-                data[field.name] = self.parse_field(
-                    input_mapping[field.name],
-                    field.type,
-                    path + (field.name,),
-                )
+                if parser is None:
+                    raise TypeError(f'Type {field_type} is not supported')
+                data[name] = parser.parse_input(input_value, field_type, path)
+            except PavlovaParsingError as exc:
+                exc.insert_path(path, name)
+                raise
             except (ValueError, TypeError) as exc:
                 raise PavlovaParsingError(
                     str(exc),
                     exc,
-                    path + (field.name,),
-                    field.type,
+                    path + (name,),
+                    field_type,
                 )
 
         return model_class(**data)  # type: ignore
 
+    def _compile_plan(self,
+                      model_class: Type,
+                      snapshot: _Snapshot) -> Tuple[_FieldPlan, ...]:
+        """Inspects a dataclass once, resolving the parser for each of its
+        fields from snapshot, so that subsequent calls to from_mapping don't
+        need to."""
+        if not dataclasses.is_dataclass(model_class):
+            raise TypeError("The root class must be a dataclass")
+
+        field_plans: List[_FieldPlan] = []
+        for field in dataclasses.fields(model_class):
+            parser = self._resolve_parser(field.type, snapshot)
+            interned = parser is not None and field.metadata.get(INTERN)
+            if interned:
+                parser = pavlova.parsers.InterningParser(
+                    self,
+                    parser,
+                    self.intern_maxsize,
+                    self._intern_table,
+                )
+            if parser is not None and self._tracer is not None:
+                parser = self._tracer.wrap_field(
+                    parser, model_class, field.name,
+                )
+            field_plans.append(_FieldPlan(
+                field.name,
+                field.type,
+                parser,
+                hasattr(model_class, field.name),
+                field.type if (self.trusted and not interned
+                               and isinstance(field.type, type))
+                else None,
+            ))
+        plan = tuple(field_plans)
+        snapshot.plans[model_class] = plan
+        return plan
+
     def parse_field(self,
                     input_value: Any,
                     field_type: Type,
                     path: Tuple[str, ...]) -> Any:
-        # pylint: disable=protected-access
+        parser = self._resolve_parser(field_type)
+        if parser is None:
+            raise TypeError(f'Type {field_type} is not supported')
 
-        if field_type in self.parsers:
-            return self.parsers[field_type].parse_input(
-                input_value, field_type, path
-            )
+        return parser.parse_input(input_value, field_type, path)
 
-        # If the type is a dataclass, go ahead and call from_mapping
-        # recursively.
-        if dataclasses.is_dataclass(field_type):
-            return self.from_mapping(
-                input_value, field_type, path
+    def _resolve_parser(
+            self,
+            field_type: Type,
+            snapshot: Optional[_Snapshot] = None,
+    ) -> Optional[PavlovaParser]:
+        """Returns the parser that handles field_type, or None if the type
+        isn't supported. The result is cached for each type annotation, as
+        lists and dictionaries resolve their item type once per item."""
+        if snapshot is None:
+            snapshot = self._snapshot
+        try:
+            return snapshot.resolved[field_type]
+        except KeyError:
+            parser = _find_in_registry(
+                snapshot.parsers, self._dataclass_parser, field_type,
             )
+            if parser is not None and self._tracer is not None:
+                parser = self._tracer.wrap_parser(parser)
+            snapshot.resolved[field_type] = parser
+            return parser
+
+    def to_mapping(self, instance: Any) -> Dict[str, Any]:
+        """Given an instance of a dataclass, return a dictionary of its
+        fields that can be encoded as JSON. This is the reverse of
+        from_mapping, using the registered serializers for each field."""
+        plan = self._get_serializer_plan(type(instance))
+        return {
+            name: getattr(instance, name) if serializer is None
+            else serializer.serialize(getattr(instance, name), field_type)
+            for name, field_type, serializer in plan
+        }
+
+    def to_mappings(self, instances: Iterable[Any]) -> List[Dict[str, Any]]:
+        "Returns the result of to_mapping for each of the instances"
+        to_mapping = self.to_mapping
+        return [to_mapping(instance) for instance in instances]
 
-        # In Python 3.7, some types, such as List, Dict, Union etc show up as
-        # type '_GenericAlias'. As such, it is very hacky to track what their
-        # types actually are, and what the calling party is intending.
-        # In Python 3.6, the types aren't _GenericAlias, but are sometimes
-        # GenericMeta, or some weird type that appears to be the same thing,
-        # but isn't (Looking at you, Union)
-        if field_type.__module__ == 'typing':
-            if getattr(field_type, '_name', None):
-                base_type = getattr(
-                    sys.modules.get(field_type.__module__),
-                    field_type._name,
+    def serialize_field(self, value: Any, field_type: Type) -> Any:
+        """Serializes a value of a field with type field_type. Values of
+        types that have no serializer are returned as they are."""
+        serializer = self._resolve_serializer(field_type)
+        if serializer is None:
+            return value
+        return serializer.serialize(value, field_type)
+
+    def _get_serializer_plan(self, model_class: Type) -> _SerializerPlan:
+        snapshot = self._snapshot
+        plan = snapshot.serializer_plans.get(model_class)
+        if plan is None:
+            if not dataclasses.is_dataclass(model_class):
+                raise TypeError("The instance must be of a dataclass")
+            plan = snapshot.serializer_plans[model_class] = tuple(
+                (
+                    field.name,
+                    field.type,
+                    self._resolve_serializer(field.type, snapshot),
                 )
-            elif hasattr(field_type, '__origin__'):
-                base_type = field_type.__origin__
+                for field in dataclasses.fields(model_class)
+            )
+        return plan
 
-            return self.parsers[base_type].parse_input(
-                input_value, field_type, path
+    def _resolve_serializer(
+            self,
+            field_type: Type,
+            snapshot: Optional[_Snapshot] = None,
+    ) -> Optional[PavlovaSerializer]:
+        """Returns the serializer that handles field_type, or None if values
+        of the type are used as they are. The result is cached for each type
+        annotation."""
+        if snapshot is None:
+            snapshot = self._snapshot
+        try:
+            return snapshot.resolved_serializers[field_type]
+        except KeyError:
+            serializer = _find_in_registry(
+                snapshot.serializers, self._dataclass_serializer, field_type,
             )
+            # Subclasses may override serialize, so only the exact class is
+            # skipped
+            # pylint: disable=unidiomatic-typecheck
+            if type(serializer) is IdentitySerializer:
+                serializer = None
+            snapshot.resolved_serializers[field_type] = serializer
+            return serializer
+
 
-        # Check to see if any of the type's parent types is something we can
-        # parse. This happens after the generic type checking, as those types
-        # do not have a class, and therefore don't have a module resolution
-        # order.
-        candidate_types = [
-            t for t in inspect.getmro(field_type) if t in self.parsers
-        ]
-        # if there is something we can use, use the most specific type, which
-        # will be the first item in the list
-        if candidate_types:
-            return self.parsers[candidate_types[0]].parse_input(
-                input_value, field_type, path
+def _find_in_registry(registry: Mapping[Any, Any],
+                      dataclass_entry: Any,
+                      field_type: Type) -> Any:
+    """Finds the entry of a registry of parsers or serializers that handles
+    field_type, or dataclass_entry if the type is a dataclass"""
+    # pylint: disable=protected-access
+
+    if field_type in registry:
+        return registry[field_type]
+
+    # If the type is a dataclass, handle it by calling from_mapping or
+    # to_mapping recursively.
+    if dataclasses.is_dataclass(field_type):
+        return dataclass_entry
+
+    # In Python 3.7, some types, such as List, Dict, Union etc show up as
+    # type '_GenericAlias'. As such, it is very hacky to track what their
+    # types actually are, and what the calling party is intending.
+    # In Python 3.6, the types aren't _GenericAlias, but are sometimes
+    # GenericMeta, or some weird type that appears to be the same thing,
+    # but isn't (Looking at you, Union)
+    if getattr(field_type, '__module__', None) == 'typing':
+        base_type = None
+        if getattr(field_type, '_name', None):
+            base_type = getattr(
+                sys.modules.get(field_type.__module__),
+                field_type._name,
+                None,
             )
+        # In Python 3.9 and above, Optional[X] is named 'Optional', but is
+        # really a Union.
+        if base_type not in registry:
+            base_type = getattr(field_type, '__origin__', None)
+
+        return registry.get(base_type)
+
+    # Check to see if any of the type's parent types is something we can
+    # parse. This happens after the generic type checking, as those types
+    # do not have a class, and therefore don't have a module resolution
+    # order.
+    # The arguments to Literal aren't types, and don't have one.
+    if not isinstance(field_type, type):
+        return None
+
+    candidate_types = [t for t in inspect.getmro(field_type) if t in registry]
+    # if there is something we can use, use the most specific type, which
+    # will be the first item in the list
+    if candidate_types:
+        return registry[candidate_types[0]]
+
+    return None
+
+
+def _missing_field_error(name: str,
+                         field_type: Type,
+                         path: Tuple[str, ...]) -> PavlovaParsingError:
+    "The error raised when a field without a default is missing"
+    return PavlovaParsingError(
+        f'Field: {name} missing',
+        TypeError(),
+        path + (name,),
+        field_type,
+    )
+
+
+def _from_mappings_chunk(pavlova_instance: Pavlova,
+                         model_class: Type[T],
+                         start: int,
+                         input_mappings: List[Mapping[Any, Any]]) -> List[T]:
+    "Parses a chunk of Pavlova.from_mappings in a worker process"
+    # pylint: disable=protected-access
+    return list(pavlova_instance._iter_from_plan(
+        input_mappings,
+        model_class,
+        pavlova_instance._get_plan(model_class),
+        start,
+    ))
+
 
-        raise TypeError(f'Type {field_type} is not supported')
+def _payload_size(payload: Any, limit: int) -> int:
+    """Counts the values in a payload, including those nested in lists and
+    dictionaries, stopping once limit is reached"""
+    size = 0
+    pending = [payload]
+    while pending and size < limit:
+        value = pending.pop()
+        size += 1
+        if isinstance(value, Mapping):
+            pending.extend(value.values())
+        elif isinstance(value, (list, tuple)):
+            pending.extend(value)
+    return size
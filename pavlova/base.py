@@ -1,13 +1,50 @@
-"The abstract class for the Pavlova class"
+"The abstract class for the Pavlova class, and the error that it raises"
 
 from abc import ABC, abstractmethod
-from typing import Any, Type, TypeVar, Mapping, Optional, Tuple
+from typing import Any, Dict, Type, TypeVar, Mapping, Optional, Tuple
 
 T = TypeVar('T')  # pylint: disable=invalid-name
 
 
+class PavlovaParsingError(Exception):
+    """The exception that will be thrown if there is a ValueError or TypeError
+    encountered when parsing a mapping."""
+    def __init__(self,
+                 message: str,
+                 original_exception: Exception,
+                 path: Tuple[str, ...],
+                 expected_type: Type) -> None:
+        super().__init__(message)
+
+        self.original_exception = original_exception
+        self.path = path
+        self.expected_type = expected_type
+
+    def insert_path(self, path: Tuple[str, ...], key: str) -> None:
+        """Inserts key into the path of the error, after path. This is used
+        to build the path as the error is raised through each parser, rather
+        than building the path for every value parsed."""
+        self.path = path + (key,) + self.path[len(path):]
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        # Allows the exception to be sent back from worker processes
+        return (
+            self.__class__,
+            (str(self), self.original_exception, self.path,
+             self.expected_type),
+        )
+
+
 class BasePavlova(ABC):
     "The base pavlova class. Use the pavlova.Pavlova class instead"
+
+    # The registered parsers, keyed by the type that they parse
+    parsers: Mapping[Any, Any]
+    # The registered serializers, keyed by the type that they serialize
+    serializers: Mapping[Any, Any]
+    # Whether values that already have the correct type can be used as is
+    trusted: bool = False
+
     @abstractmethod
     def from_mapping(self,
                      input_mapping: Mapping[Any, Any],
@@ -23,3 +60,13 @@ class BasePavlova(ABC):
                     path: Tuple[str, ...]) -> Any:
         "Parse a particular field with type field_type"
         pass
+
+    @abstractmethod
+    def to_mapping(self, instance: Any) -> Dict[str, Any]:
+        "Return a dictionary of the fields of a dataclass instance"
+        pass
+
+    @abstractmethod
+    def serialize_field(self, value: Any, field_type: Type) -> Any:
+        "Serialize a particular value of a field with type field_type"
+        pass
@@ -0,0 +1,159 @@
+"""Caches the instances parsed from mappings, so that parsing the same mapping
+again returns the same instance"""
+
+import array
+from collections import OrderedDict
+from collections.abc import Mapping
+import threading
+import time
+import typing
+from typing import Any, Callable, Dict, Optional, Set, Tuple, Type
+
+import dataclasses
+
+
+# Returned by ResultCache.get when there is no cached instance
+MISSING: Any = object()
+
+
+def structural_key(value: Any) -> Any:
+    """Returns a hashable key for a mapping parsed from JSON, form data or a
+    query string, that is equal for mappings with the same contents. The type
+    of each value other than a string is part of the key, as 1, 1.0 and True
+    are equal but may be parsed differently. Raises a TypeError if the
+    mapping contains a value that can't be hashed."""
+    value_class = value.__class__
+    # Strings are by far the most common value, and are never equal to a
+    # value of another type, so they are checked first and used as they are
+    if value_class is str:
+        return value
+    if value_class is dict or isinstance(value, Mapping):
+        return frozenset([
+            (
+                key if key.__class__ is str else (key.__class__, key),
+                structural_key(item),
+            )
+            for key, item in value.items()
+        ])
+    if value_class is list:
+        return (list, tuple([  # pylint: disable=consider-using-generator
+            structural_key(item) for item in value
+        ]))
+    return (value_class, value)
+
+
+# The types of field whose values can be changed in place, so can't be
+# shared between the callers that a cached instance is returned to
+_MUTABLE_TYPES = (list, dict, set, bytearray, array.array)
+
+
+def check_immutable(model_class: Type) -> None:
+    """Raises a TypeError if model_class isn't a frozen dataclass, or has a
+    field whose value can be changed in place, such as a list, dictionary,
+    set, array or dataclass that isn't frozen. Fields of nested dataclasses,
+    and the members of Optionals, unions and other generic types, are
+    checked as well. Other types are assumed to be immutable."""
+    if not dataclasses.is_dataclass(model_class):
+        raise TypeError("The root class must be a dataclass")
+    _check_dataclass(model_class, set())
+
+
+def _check_dataclass(model_class: Type, seen: Set[Type]) -> None:
+    if not model_class.__dataclass_params__.frozen:  # type: ignore
+        raise TypeError(
+            f'{model_class.__name__} must be a frozen dataclass to cache '
+            'its instances'
+        )
+    seen.add(model_class)
+    for field in dataclasses.fields(model_class):
+        if _is_mutable(field.type, seen):
+            raise TypeError(
+                f'{model_class.__name__}.{field.name} has the mutable type '
+                f'{field.type}, so its instances can\'t be cached'
+            )
+
+
+def _is_mutable(field_type: Any, seen: Set[Type]) -> bool:
+    if dataclasses.is_dataclass(field_type):
+        if field_type not in seen:
+            _check_dataclass(field_type, seen)
+        return False
+
+    origin = getattr(field_type, '__origin__', None)
+    if origin is not None:
+        # The arguments of a Literal are values rather than types
+        if origin is getattr(typing, 'Literal', None):
+            return False
+        if _is_mutable(origin, seen):
+            return True
+        return any(
+            _is_mutable(argument, seen)
+            for argument in getattr(field_type, '__args__', None) or ()
+        )
+
+    return isinstance(field_type, type) and issubclass(
+        field_type, _MUTABLE_TYPES,
+    )
+
+
+class ResultCache:
+    """A bounded cache of the instances of one dataclass, keyed by the
+    structural key of the mapping that they were parsed from. The least
+    recently used instance is evicted once maxsize instances are cached, and
+    if ttl is set, instances expire ttl seconds after they were parsed."""
+
+    def __init__(self,
+                 maxsize: int = 1024,
+                 ttl: Optional[float] = None,
+                 clock: Callable[[], float] = time.monotonic) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.clock = clock
+        self.hits = 0
+        self.misses = 0
+        # Each key is mapped to the instance, and the time that it expires
+        self._entries: 'OrderedDict[Any, Tuple[Any, float]]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # Only the settings are pickled, as the instances may not be
+        # picklable, and the lock can't be
+        state = self.__dict__.copy()
+        state['_entries'] = OrderedDict()
+        del state['_lock']
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Any) -> Any:
+        "Returns the instance cached for key, or MISSING"
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                value, expires = entry
+                if expires >= self.clock():
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return value
+                del self._entries[key]
+            self.misses += 1
+            return MISSING
+
+    def put(self, key: Any, value: Any) -> None:
+        "Caches value for key, evicting the least recently used if full"
+        expires = float('inf') if self.ttl is None else self.clock() + self.ttl
+        with self._lock:
+            self._entries[key] = (value, expires)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        "Removes every cached instance, keeping the hit and miss counts"
+        with self._lock:
+            self._entries.clear()
@@ -0,0 +1,156 @@
+#pylint: disable=unused-argument
+"""Decodes JSON documents for from_json. The json module is used by default,
+while faster libraries, such as orjson, can be picked with get_decoder"""
+
+import functools
+import json
+from typing import Any, Callable, Dict, Optional, Type, Union
+
+
+# The input accepted by from_json
+JsonInput = Union[bytes, bytearray, memoryview, str]
+
+# Returned by decode_typed when a document can't be decoded straight into
+# the model class, so it should be decoded and parsed as usual instead
+UNTYPED: Any = object()
+
+
+class JsonDecoder:
+    """Decodes JSON documents with a loads function, such as json.loads or
+    orjson.loads. Invalid documents raise a ValueError.
+
+    If memoryviews is not set, memoryviews are copied to bytes before they
+    are passed to loads."""
+
+    # The name of the library, which is used in the repr
+    name = 'json'
+
+    def __init__(self,
+                 loads: Callable[[Any], Any] = json.loads,
+                 memoryviews: bool = False) -> None:
+        self.loads = loads
+        self.memoryviews = memoryviews
+
+    def __repr__(self) -> str:
+        return f'<{type(self).__name__} {self.name}>'
+
+    def decode(self, data: JsonInput) -> Any:
+        "Decodes a JSON document into dictionaries, lists and values"
+        if isinstance(data, memoryview) and not self.memoryviews:
+            data = data.tobytes()
+        return self.loads(data)
+
+    def decode_typed(self, data: JsonInput, model_type: Type) -> Any:
+        """Decodes a JSON document straight into model_type, or returns
+        UNTYPED if this isn't supported for the document"""
+        return UNTYPED
+
+
+class MsgspecDecoder(JsonDecoder):
+    """Decodes JSON documents with msgspec. If typed is set, decode_typed
+    decodes documents straight into dataclasses, without building the
+    dictionaries, which Pavlova only does in trusted mode. msgspec only
+    accepts values that already have the type of their field, and doesn't
+    use the registered parsers, so documents that it rejects are decoded
+    and parsed as usual."""
+
+    name = 'msgspec'
+
+    def __init__(self, typed: bool = False) -> None:
+        # pylint: disable=import-outside-toplevel,import-error
+        import msgspec
+        super().__init__(msgspec.json.decode, memoryviews=True)
+        self.typed = typed
+        # ValidationError, which is raised when a value has the wrong type,
+        # is a subclass of DecodeError
+        self._error = msgspec.DecodeError
+        # The msgspec decoder for each model type, or None if msgspec
+        # doesn't support the type
+        self._typed_decoders: Dict[Type, Any] = {}
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # msgspec's functions and decoders can't be pickled
+        return {'typed': self.typed}
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__init__(state['typed'])  # type: ignore
+
+    def decode(self, data: JsonInput) -> Any:
+        try:
+            return self.loads(data)
+        except self._error as exc:
+            # msgspec's errors aren't ValueErrors
+            raise ValueError(str(exc)) from exc
+
+    def decode_typed(self, data: JsonInput, model_type: Type) -> Any:
+        if not self.typed:
+            return UNTYPED
+
+        typed_decoder = self._get_typed_decoder(model_type)
+        if typed_decoder is None:
+            return UNTYPED
+        try:
+            return typed_decoder.decode(data)
+        except self._error:
+            # Either the document is invalid, which decode reports, or a
+            # value needs to be parsed
+            return UNTYPED
+
+    def _get_typed_decoder(self, model_type: Type) -> Optional[Any]:
+        try:
+            return self._typed_decoders[model_type]
+        except KeyError:
+            pass
+
+        # pylint: disable=import-outside-toplevel,import-error
+        import msgspec
+        try:
+            typed_decoder: Optional[Any] = msgspec.json.Decoder(model_type)
+        except TypeError:
+            typed_decoder = None
+        self._typed_decoders[model_type] = typed_decoder
+        return typed_decoder
+
+
+def _orjson_decoder() -> JsonDecoder:
+    # pylint: disable=import-outside-toplevel,import-error,no-member
+    import orjson
+    decoder = JsonDecoder(orjson.loads, memoryviews=True)
+    decoder.name = 'orjson'
+    return decoder
+
+
+def _ujson_decoder() -> JsonDecoder:
+    # pylint: disable=import-outside-toplevel,import-error
+    import ujson
+    decoder = JsonDecoder(ujson.loads)
+    decoder.name = 'ujson'
+    return decoder
+
+
+# The decoders that can be picked by name
+DECODERS: Dict[str, Callable[[], JsonDecoder]] = {
+    'orjson': _orjson_decoder,
+    'msgspec': MsgspecDecoder,
+    'ujson': _ujson_decoder,
+    'json': JsonDecoder,
+}
+
+
+def get_decoder(name: str) -> JsonDecoder:
+    """Returns the decoder for one of the libraries in DECODERS. Raises an
+    ImportError if the library isn't installed."""
+    try:
+        factory = DECODERS[name]
+    except KeyError:
+        raise ValueError(f'Unknown JSON decoder: {name!r}') from None
+    return factory()
+
+
+@functools.lru_cache(maxsize=None)
+def default_decoder() -> JsonDecoder:
+    """Returns the decoder used when Pavlova.json_decoder isn't set, which
+    uses the json module. The other libraries decode some documents
+    differently, for example orjson rejects NaN and turns integers larger
+    than 64 bits into floats, so they are only used when picked."""
+    return JsonDecoder()
@@ -1,41 +1,166 @@
 "Allows you to use Pavlova effortlessly from Flask"
 
 from functools import wraps
-from typing import Any, Callable, Dict, Type, TypeVar
+from typing import (
+    Any, Callable, Dict, Iterator, List, Mapping, Optional, Type, TypeVar,
+    Union
+)
 
+import dataclasses
 import flask
 
 from pavlova import Pavlova
+from pavlova.decoders import JsonDecoder
+from pavlova.streams import DEFAULT_CHUNK_SIZE, iter_json_array
 
 
 T = TypeVar('T')  # pylint: disable=invalid-name
 
 
+class _LayeredMapping(Mapping[Any, Any]):
+    """A read only view of several mappings, where the values in earlier
+    mappings take precedence over those in later mappings"""
+
+    def __init__(self, *layers: Mapping[Any, Any]) -> None:
+        self.layers = layers
+
+    def __getitem__(self, key: Any) -> Any:
+        for layer in self.layers:
+            if key in layer:
+                return layer[key]
+        raise KeyError(key)
+
+    def __contains__(self, key: Any) -> bool:
+        return any(key in layer for layer in self.layers)
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter({key: None for layer in self.layers for key in layer})
+
+    def __len__(self) -> int:
+        return len({key for layer in self.layers for key in layer})
+
+
 class FlaskPavlova(Pavlova):
-    "The flask adaptor for Pavlova"
+    """The flask adaptor for Pavlova. The JSON body of requests is decoded
+    with json_decoder, the same as from_json, which uses the json module
+    unless it is set. If json_loads is given, such as orjson.loads, it is
+    used to decode the body instead."""
+
+    # The number of bytes read from the request at a time, when parsing a
+    # JSON array for an endpoint that uses a list of dataclasses
+    stream_chunk_size: int = DEFAULT_CHUNK_SIZE
+
+    def __init__(self,
+                 *args: Any,
+                 json_loads: Optional[
+                     Callable[[Union[str, bytes]], Any]
+                 ] = None,
+                 **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        if json_loads is not None:
+            self.json_decoder = JsonDecoder(json_loads)
 
-    def use(self, model_class: Type[T]) -> Callable:
+    def use(self, model_class: Any, eager: bool = False) -> Callable:
         """Wraps a flask endpoint, parses the data coming in via json or form
         data, then passes it to the function as an argument.
+
+        If model_class is a list of dataclasses, such as List[Model], the
+        request body must be a JSON array. The function is passed an iterator
+        that reads and parses each item of the array from the request as it
+        is consumed, so that the whole body is never held in memory.
+
+        If eager is set, the parsers for model_class are resolved straight
+        away, rather than when the first request is received.
+
+        If the function returns a dataclass instance or a list of them,
+        optionally as the first item of a tuple with a status code or
+        headers, it is converted with to_mapping and returned as JSON.
         """
+        item_class = _get_list_item_class(model_class)
+        if eager:
+            self.warmup(item_class or model_class)
+
         def _wrapper(func: Callable) -> Callable:
             @wraps(func)
             def wrap(*args: Any, **kwargs: Dict[Any, Any]) -> Any:
                 new_args = list(args)
-                new_args.append(self._from_flask_request(model_class))
-                return func(*new_args, **kwargs)
+                if item_class is None:
+                    new_args.append(self._from_flask_request(model_class))
+                else:
+                    new_args.append(self._iter_flask_request(item_class))
+                return self._make_response(func(*new_args, **kwargs))
             return wrap
         return _wrapper
 
+    def _make_response(self, result: Any) -> Any:
+        "Converts dataclasses returned by an endpoint to a JSON response"
+        if isinstance(result, tuple) and result:
+            return (self._make_response(result[0]),) + result[1:]
+        if _is_instance(result):
+            return flask.jsonify(self.to_mapping(result))
+        if (isinstance(result, list) and result
+                and all(_is_instance(item) for item in result)):
+            return flask.jsonify(self.to_mappings(result))
+        return result
+
+    def _iter_flask_request(self, item_class: Type[T]) -> Iterator[T]:
+        request = flask.request
+        items = iter_json_array(request.stream, self.stream_chunk_size)
+        try:
+            yield from self.iter_from_mappings(_check_items(items), item_class)
+        except ValueError as exc:
+            # Raises a 400 Bad Request, the same as request.get_json
+            request.on_json_loading_failed(exc)
+
     def _from_flask_request(self, model_class: Type[T]) -> T:
-        json_body: Dict[str, Any] = {}
-        if flask.request.is_json:
-            json_body = flask.request.get_json()
-
-        return self.from_mapping(
-            {
-                **json_body,
-                **flask.request.values.to_dict()
-            },
-            model_class
-        )
+        request = flask.request
+        # The query string takes precedence over form data, which takes
+        # precedence over the JSON body. Rather than merging these into a new
+        # dictionary, they are read through a view, skipping any that are
+        # empty.
+        layers: List[Mapping[Any, Any]] = [
+            layer for layer in (request.args, request.form) if layer
+        ]
+        if request.is_json:
+            # If the body is the only input, it may be decoded straight into
+            # model_class, the same as from_json. The body is kept, so that
+            # the endpoint can still read it with request.get_json.
+            try:
+                json_body, typed = self._decode_json(
+                    request.get_data(),
+                    None if layers else model_class,
+                )
+            except ValueError as exc:
+                # Raises a 400 Bad Request, the same as request.get_json
+                return request.on_json_loading_failed(exc)
+            if typed:
+                return json_body
+            layers.append(json_body)
+
+        if len(layers) == 1:
+            return self.from_mapping(layers[0], model_class)
+        return self.from_mapping(_LayeredMapping(*layers), model_class)
+
+
+def _get_list_item_class(model_class: Any) -> Optional[Type]:
+    "If model_class is a list of dataclasses, return the type of the items"
+    if getattr(model_class, '__origin__', None) not in (list, List):
+        return None
+
+    item_class = model_class.__args__[0]
+    if not dataclasses.is_dataclass(item_class):
+        raise TypeError('Lists must contain dataclasses')
+    return item_class
+
+
+def _is_instance(value: Any) -> bool:
+    "Whether value is an instance of a dataclass, rather than the class"
+    return dataclasses.is_dataclass(value) and not isinstance(value, type)
+
+
+def _check_items(items: Iterator[Any]) -> Iterator[Mapping[Any, Any]]:
+    "Checks that each item of a JSON array is an object"
+    for item in items:
+        if not isinstance(item, Mapping):
+            raise ValueError('The JSON array must only contain objects')
+        yield item
@@ -0,0 +1,189 @@
+#pylint: disable=too-few-public-methods
+"""Lazy instances of dataclasses, which parse each field the first time that
+it is read, rather than when the instance is created"""
+
+import reprlib
+from typing import Any, Dict, Mapping, Sequence, Tuple, Type
+
+import dataclasses
+
+from pavlova.base import BasePavlova, PavlovaParsingError
+
+
+# The attribute of a lazy instance that holds its _LazyState
+_STATE = '_pavlova_lazy_state'
+
+# The lazy subclass generated for each dataclass
+_lazy_classes: Dict[Type, Type] = {}
+
+
+class _LazyState:
+    "The input and parsers needed to parse the fields of a lazy instance"
+
+    __slots__ = (
+        'pavlova', 'input_mapping', 'plan', 'path', 'dataclass_parser',
+    )
+
+    def __init__(self,
+                 pavlova_instance: BasePavlova,
+                 input_mapping: Mapping[Any, Any],
+                 plan: Sequence[Any],
+                 path: Tuple[str, ...],
+                 dataclass_parser: Any) -> None:
+        self.pavlova = pavlova_instance
+        self.input_mapping = input_mapping
+        self.plan = plan
+        self.path = path
+        self.dataclass_parser = dataclass_parser
+
+    def parse(self, index: int, field: dataclasses.Field) -> Any:
+        "Parses the field at index of the plan, the same as from_mapping"
+        name, field_type, parser, _, exact_type = self.plan[index]
+        if name not in self.input_mapping:
+            default_factory = field.default_factory  # type: ignore
+            if default_factory is not dataclasses.MISSING:
+                return default_factory()
+            return field.default
+
+        input_value = self.input_mapping[name]
+        # pylint: disable=unidiomatic-typecheck
+        if type(input_value) is exact_type:
+            return input_value
+
+        try:
+            if parser is None:
+                raise TypeError(f'Type {field_type} is not supported')
+            # Nested dataclasses are lazy as well. These are given the whole
+            # path, as their errors are raised after this call has returned.
+            if parser is self.dataclass_parser:
+                return self.pavlova.lazy_from_mapping(  # type: ignore
+                    input_value, field_type, self.path + (name,),
+                )
+            return parser.parse_input(input_value, field_type, self.path)
+        except PavlovaParsingError as exc:
+            if parser is not self.dataclass_parser:
+                exc.insert_path(self.path, name)
+            raise
+        except (ValueError, TypeError) as exc:
+            raise PavlovaParsingError(
+                str(exc),
+                exc,
+                self.path + (name,),
+                field_type,
+            ) from exc
+
+
+class _LazyField:
+    """A non-data descriptor that parses a field when it is first read. The
+    parsed value is stored in the instance's __dict__, which takes
+    precedence over the descriptor when the field is read again."""
+
+    def __init__(self, index: int, field: dataclasses.Field) -> None:
+        self.index = index
+        self.field = field
+
+    def __get__(self, instance: Any, owner: Type) -> Any:
+        if instance is None:
+            return self
+        value = instance.__dict__[_STATE].parse(self.index, self.field)
+        instance.__dict__[self.field.name] = value
+        return value
+
+
+def lazy_class(model_class: Type) -> Type:
+    """Returns the lazy subclass of a dataclass, which has a _LazyField for
+    each of its fields"""
+    cls = _lazy_classes.get(model_class)
+    if cls is None:
+        namespace: Dict[str, Any] = {
+            field.name: _LazyField(index, field)
+            for index, field in enumerate(dataclasses.fields(model_class))
+        }
+        params = model_class.__dataclass_params__  # type: ignore
+        if params.eq:
+            namespace['__eq__'] = _make_eq(model_class)
+            # Defining __eq__ would otherwise remove the inherited __hash__
+            namespace['__hash__'] = model_class.__hash__
+        if params.repr:
+            namespace['__repr__'] = _make_repr(model_class)
+        namespace['__reduce__'] = _make_reduce(model_class)
+        namespace['__module__'] = model_class.__module__
+        namespace['__qualname__'] = f'Lazy{model_class.__qualname__}'
+        cls = type(f'Lazy{model_class.__name__}', (model_class,), namespace)
+        cls = _lazy_classes.setdefault(model_class, cls)
+    return cls
+
+
+def _make_eq(model_class: Type) -> Any:
+    """Returns an __eq__ for the lazy subclass of model_class, so that its
+    instances compare equal to instances of model_class, and vice versa"""
+    names = [
+        field.name for field in dataclasses.fields(model_class)
+        if field.compare
+    ]
+
+    def __eq__(self: Any, other: Any) -> Any:
+        # Subclasses of model_class, other than the lazy one, may add fields
+        if type(other) not in (type(self), model_class):
+            return NotImplemented
+        return all(
+            getattr(self, name) == getattr(other, name) for name in names
+        )
+    return __eq__
+
+
+def _make_repr(model_class: Type) -> Any:
+    """Returns a __repr__ for the lazy subclass of model_class, which shows
+    the name of model_class, the same as the dataclass's own __repr__"""
+    names = [
+        field.name for field in dataclasses.fields(model_class)
+        if field.repr
+    ]
+
+    @reprlib.recursive_repr()
+    def __repr__(self: Any) -> str:
+        values = ', '.join(
+            f'{name}={getattr(self, name)!r}' for name in names
+        )
+        return f'{model_class.__qualname__}({values})'
+    return __repr__
+
+
+def _make_reduce(model_class: Type) -> Any:
+    """Returns a __reduce__ for the lazy subclass of model_class, which
+    pickles its instances as instances of model_class. The lazy subclass
+    can't be found by its name, so can't be pickled itself."""
+    names = [field.name for field in dataclasses.fields(model_class)]
+
+    def __reduce__(self: Any) -> Any:
+        # Every field is parsed, so that the input isn't pickled
+        return _restore, (
+            model_class, {name: getattr(self, name) for name in names},
+        )
+    return __reduce__
+
+
+def _restore(model_class: Type, values: Dict[str, Any]) -> Any:
+    """Creates an instance of model_class with the values of its fields,
+    without calling its __init__, the same as pickle does for dataclasses"""
+    instance = object.__new__(model_class)
+    for name, value in values.items():
+        # This works for frozen dataclasses as well
+        object.__setattr__(instance, name, value)
+    return instance
+
+
+def create(pavlova_instance: BasePavlova,
+           input_mapping: Mapping[Any, Any],
+           model_class: Type,
+           plan: Sequence[Any],
+           path: Tuple[str, ...],
+           dataclass_parser: Any) -> Any:
+    """Creates a lazy instance of model_class, without calling its __init__,
+    which parses input_mapping using plan as its fields are read"""
+    # pylint: disable=too-many-arguments,too-many-positional-arguments
+    instance = object.__new__(lazy_class(model_class))
+    instance.__dict__[_STATE] = _LazyState(
+        pavlova_instance, input_mapping, plan, path, dataclass_parser,
+    )
+    return instance
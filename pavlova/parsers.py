@@ -3,14 +3,19 @@
 "This module contains all of the built in parsers for Pavlova"
 
 from abc import ABC, abstractmethod
+import array
 import datetime
 from decimal import Decimal
 from enum import Enum
-from typing import Any, List, Dict, Union, Type, TypeVar, Generic, Tuple
+import dataclasses
+import functools
+import re
+import sys
+from typing import (
+    Any, List, Dict, Mapping, Optional, Union, Type, TypeVar, Generic, Tuple
+)
 
-import dateparser
-
-from pavlova.base import BasePavlova
+from pavlova.base import BasePavlova, PavlovaParsingError
 
 
 T = TypeVar('T')  # pylint: disable=invalid-name
@@ -30,6 +35,12 @@ class PavlovaParser(Generic[T], ABC):
         "Given an input, return it's typed value"
         pass
 
+    def warmup(self, field_type: Type) -> None:
+        """Called by Pavlova.warmup for each type that this parser handles,
+        so that any expensive resources can be loaded before the first value
+        is parsed"""
+        pass
+
 
 class BoolParser(PavlovaParser[bool]):
     "Parses a Boolean"
@@ -61,10 +72,23 @@ class ListParser(PavlovaParser[List[T]]):
             raise TypeError(f'Input value: {input_value} is not a list')
 
         sub_type = field_type.__args__[0]
-        return [
-            self.pavlova.parse_field(f, sub_type, path + (f'[{i}]',))
-            for i, f in enumerate(input_value)
-        ]
+        if self.pavlova.trusted and _all_of_type(input_value, sub_type):
+            return input_value
+        if _is_bulk_type(self.pavlova, sub_type):
+            return _bulk_convert(input_value, sub_type)
+
+        parse_field = self.pavlova.parse_field
+        values = []
+        index = 0
+        # The index is only added to the path when there is an error, to avoid
+        # allocating a new path for every item.
+        try:
+            for index, item in enumerate(input_value):
+                values.append(parse_field(item, sub_type, path))
+        except PavlovaParsingError as exc:
+            exc.insert_path(path, f'[{index}]')
+            raise
+        return values
 
 
 class IntParser(PavlovaParser[int]):
@@ -107,6 +131,88 @@ class StringParser(PavlovaParser[str]):
         return str(input_value)
 
 
+# The built in parsers that only call their type on the input value, so can be
+# used to convert a whole list at once, along with their type.
+_BULK_PARSERS: Dict[Type, Type[PavlovaParser]] = {
+    int: IntParser,
+    float: FloatParser,
+    str: StringParser,
+    Decimal: DecimalParser,
+}
+
+
+def _is_bulk_type(pavlova_instance: BasePavlova, sub_type: Any) -> bool:
+    "Whether a list of sub_type can be converted with _bulk_convert"
+    parser_class = _BULK_PARSERS.get(sub_type)
+    # The parser may have been replaced using register_parser
+    # pylint: disable=unidiomatic-typecheck
+    return parser_class is not None and type(
+        pavlova_instance.parsers.get(sub_type)
+    ) is parser_class
+
+
+def _all_of_type(values: Any, value_type: Any) -> bool:
+    "Whether every item of values has exactly the type value_type"
+    return set(map(type, values)) <= {value_type}
+
+
+def _bulk_convert(input_value: Any, sub_type: Type[T]) -> List[T]:
+    "Converts each item of input_value to sub_type"
+    if _all_of_type(input_value, sub_type):
+        return list(input_value)
+    return list(map(sub_type, input_value))
+
+
+class ArrayParser(PavlovaParser[array.array]):
+    """Parses a list of numbers into an array.array, which stores them far
+    more compactly than a list. By default, the array holds floats. For other
+    types, register an ArrayParser with the array's typecode."""
+
+    def __init__(self,
+                 pavlova_instance: BasePavlova,
+                 typecode: str = 'd') -> None:
+        super().__init__(pavlova_instance)
+        self.typecode = typecode
+        self._convert = float if typecode in ('f', 'd') else int
+
+    def parse_input(self,
+                    input_value: Any,
+                    field_type: Type,
+                    path: Tuple[str, ...]) -> array.array:
+        if isinstance(input_value, array.array):
+            if input_value.typecode == self.typecode:
+                return input_value
+        elif not isinstance(input_value, (list, tuple)):
+            raise TypeError(f'Input value: {input_value} is not a list')
+
+        return array.array(self.typecode, map(self._convert, input_value))
+
+
+class NdarrayParser(PavlovaParser[Any]):
+    """Parses a list into a NumPy array, with the given dtype. NumPy isn't a
+    dependency of Pavlova, so to use this register it for numpy.ndarray:
+
+        pavlova.register_parser(numpy.ndarray, NdarrayParser(pavlova, 'f8'))
+    """
+
+    def __init__(self,
+                 pavlova_instance: BasePavlova,
+                 dtype: Any = None) -> None:
+        super().__init__(pavlova_instance)
+        self.dtype = dtype
+
+    def parse_input(self,
+                    input_value: Any,
+                    field_type: Type,
+                    path: Tuple[str, ...]) -> Any:
+        # pylint: disable=import-outside-toplevel,import-error
+        import numpy
+
+        if not isinstance(input_value, (list, tuple, numpy.ndarray)):
+            raise TypeError(f'Input value: {input_value} is not a list')
+        return numpy.asarray(input_value, dtype=self.dtype)
+
+
 class DictParser(PavlovaParser[Dict]):
     "Parses a dictionary"
 
@@ -120,25 +226,159 @@ class DictParser(PavlovaParser[Dict]):
 
         key_type = field_type.__args__[0]
         value_type = field_type.__args__[1]
-        return {
-            self.pavlova.parse_field(k, key_type, path):
-            self.pavlova.parse_field(v, value_type, path + (k,))
-            for k, v in input_value.items()
-        }
-
-
-class DatetimeParser(PavlovaParser[datetime.datetime]):
-    "Parses a datetime"
+        if (self.pavlova.trusted
+                and _all_of_type(input_value, key_type)
+                and _all_of_type(input_value.values(), value_type)):
+            return input_value
+
+        parse_field = self.pavlova.parse_field
+        values = {}
+        for key, value in input_value.items():
+            parsed_key = parse_field(key, key_type, path)
+            # The key is only added to the path when there is an error, to
+            # avoid allocating a new path for every value.
+            try:
+                values[parsed_key] = parse_field(value, value_type, path)
+            except PavlovaParsingError as exc:
+                exc.insert_path(path, key)
+                raise
+        return values
+
+
+class DatetimeMode(Enum):
+    "The ways that the DatetimeParser can interpret its input"
+
+    # Only accept ISO-8601/RFC-3339 strings and epoch timestamps
+    STRICT = 'strict'
+    # Accept ISO-8601/RFC-3339 strings and epoch timestamps, falling back to
+    # dateparser for anything else
+    FAST = 'fast'
+    # Parse everything with dateparser
+    FUZZY = 'fuzzy'
+
+
+# Matches any letter. Strings containing letters, such as "yesterday" or
+# "in 2 days", may be relative to the current time, so they aren't cached.
+# Other strings may still be relative to the current date, see _parse_fuzzy.
+_LETTER_REGEX = re.compile(r'[^\W\d_]')
+
+
+def _import_dateparser() -> Any:
+    # dateparser takes a long time to import, as it loads all of its language
+    # data, so it is only imported once it is needed.
+    import dateparser  # pylint: disable=import-outside-toplevel
+    return dateparser
+
+
+def _parse_dateparser(input_value: Any) -> Optional[datetime.datetime]:
+    return _import_dateparser().parse(input_value)
+
+
+def _parse_dateparser_on(input_value: Any,
+                         today: datetime.date) -> Optional[datetime.datetime]:
+    # today is only used as part of the key of the LRU cache
+    return _parse_dateparser(input_value)
+
+
+def _parse_iso(input_value: str) -> datetime.datetime:
+    if sys.version_info < (3, 7):
+        raise ValueError('ISO-8601 parsing requires Python 3.7 or higher')
+    # datetime.fromisoformat only accepts a trailing Z from Python 3.11
+    if sys.version_info < (3, 11) and input_value[-1:] in ('Z', 'z'):
+        input_value = input_value[:-1] + '+00:00'
+    return datetime.datetime.fromisoformat(input_value)
+
+
+class DatetimeParser(PavlovaParser[Optional[datetime.datetime]]):
+    """Parses a datetime. As before, dateparser returns None for strings
+    that it can't parse."""
+
+    def __init__(self,
+                 pavlova_instance: BasePavlova,
+                 mode: DatetimeMode = DatetimeMode.FAST,
+                 cache_size: int = 1024) -> None:
+        super().__init__(pavlova_instance)
+        self.mode = mode
+        self.cache_size = cache_size
+        self._parse_fuzzy_cached = functools.lru_cache(maxsize=cache_size)(
+            _parse_dateparser_on
+        )
+
+    def __getstate__(self) -> Dict[str, Any]:
+        state = self.__dict__.copy()
+        del state['_parse_fuzzy_cached']
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._parse_fuzzy_cached = functools.lru_cache(
+            maxsize=self.cache_size,
+        )(_parse_dateparser_on)
 
     def parse_input(self,
                     input_value: Any,
                     field_type: Type,
-                    path: Tuple[str, ...]) -> datetime.datetime:
-        return dateparser.parse(input_value)
+                    path: Tuple[str, ...]) -> Optional[datetime.datetime]:
+        if self.mode is DatetimeMode.FUZZY:
+            return self._parse_fuzzy(input_value)
+
+        if isinstance(input_value, str):
+            try:
+                return _parse_iso(input_value)
+            except ValueError:
+                if self.mode is DatetimeMode.STRICT:
+                    raise
+                return self._parse_fuzzy(input_value)
+
+        if isinstance(input_value, datetime.datetime):
+            return input_value
+
+        if (isinstance(input_value, (int, float))
+                and not isinstance(input_value, bool)):
+            try:
+                return datetime.datetime.fromtimestamp(
+                    input_value, datetime.timezone.utc,
+                )
+            except (OverflowError, OSError) as exc:
+                # Raised for timestamps out of the range of the platform's
+                # time_t, which are reported like any other invalid value
+                raise ValueError(
+                    f'{input_value} is not a valid timestamp'
+                ) from exc
+
+        raise TypeError(f'{input_value} is not a valid datetime value')
+
+    def warmup(self, field_type: Type) -> None:
+        if self.mode is not DatetimeMode.STRICT:
+            _import_dateparser()
+
+    def _parse_fuzzy(self,
+                     input_value: Any) -> Optional[datetime.datetime]:
+        if (isinstance(input_value, str)
+                and not _LETTER_REGEX.search(input_value)):
+            # dateparser fills in the missing parts of a date from today,
+            # such as the year of '15/03' or the date of '10:00', so the
+            # date is part of the key
+            return self._parse_fuzzy_cached(
+                input_value, datetime.date.today(),
+            )
+        return _parse_dateparser(input_value)
 
 
 class UnionParser(PavlovaParser[Union[T]]):
-    "Parses an Union"
+    """Parses an Union. Only Optional types, and unions of dataclasses that
+    can be told apart by a Literal field, are supported."""
+
+    def __init__(self, pavlova_instance: BasePavlova) -> None:
+        super().__init__(pavlova_instance)
+        # The parser for each union of dataclasses, or None if the union
+        # doesn't have a discriminator field
+        self._tagged: Dict[Any, Optional[TaggedUnionParser]] = {}
+
+    def __getstate__(self) -> Dict[str, Any]:
+        state = self.__dict__.copy()
+        state['_tagged'] = {}
+        return state
 
     @staticmethod
     def _is_from_optional(field_type: Type) -> bool:
@@ -154,12 +394,35 @@ class UnionParser(PavlovaParser[Union[T]]):
 
         return True
 
+    def _get_tagged_parser(
+            self,
+            field_type: Type,
+    ) -> Optional['TaggedUnionParser']:
+        try:
+            return self._tagged[field_type]
+        except KeyError:
+            parser = None
+            discriminator = _find_discriminator(field_type)
+            if discriminator is not None:
+                parser = TaggedUnionParser(self.pavlova, discriminator)
+            self._tagged[field_type] = parser
+            return parser
+
+    def warmup(self, field_type: Type) -> None:
+        if not self._is_from_optional(field_type):
+            parser = self._get_tagged_parser(field_type)
+            if parser is not None:
+                parser.warmup(field_type)
+
     def parse_input(self,
                     input_value: Any,
                     field_type: Type,
                     path: Tuple[str, ...]) -> T:
         if not self._is_from_optional(field_type):
-            raise TypeError('Unions of this type are not allowed')
+            parser = self._get_tagged_parser(field_type)
+            if parser is None:
+                raise TypeError('Unions of this type are not allowed')
+            return parser.parse_input(input_value, field_type, path)
 
         real_field_type = field_type.__args__[0]
         # fast exit when field_type is Optional and input_value is None
@@ -168,25 +431,225 @@ class UnionParser(PavlovaParser[Union[T]]):
         return self.pavlova.parse_field(input_value, real_field_type, path)
 
 
+def _union_members(field_type: Type) -> List[Type]:
+    none_type: Any = type(None)
+    return [t for t in field_type.__args__ if t is not none_type]
+
+
+def _is_literal(field_type: Type) -> bool:
+    origin = getattr(field_type, '__origin__', None)
+    return getattr(origin, '_name', None) == 'Literal'
+
+
+def _find_discriminator(field_type: Type) -> Optional[str]:
+    """Finds the name of the field that is annotated with a Literal in every
+    dataclass of a union, if there is exactly one"""
+    if not hasattr(field_type, '__args__'):
+        return None
+
+    members = _union_members(field_type)
+    if not all(dataclasses.is_dataclass(m) for m in members):
+        return None
+
+    names = None
+    for member in members:
+        literal_names = {
+            f.name for f in dataclasses.fields(member) if _is_literal(f.type)
+        }
+        names = literal_names if names is None else names & literal_names
+
+    if not names or len(names) != 1:
+        return None
+    return names.pop()
+
+
+class TaggedUnionParser(PavlovaParser[T]):
+    """Parses a union of dataclasses, choosing which dataclass to parse by
+    the value of the discriminator field.
+
+    By default, the values for each dataclass are taken from the discriminator
+    field's Literal annotation, or otherwise its default value. To set them
+    explicitly, pass in a mapping of values to dataclasses as tags.
+    """
+
+    def __init__(self,
+                 pavlova_instance: BasePavlova,
+                 discriminator: str,
+                 tags: Optional[Mapping[Any, Type]] = None) -> None:
+        super().__init__(pavlova_instance)
+        self.discriminator = discriminator
+        self.tags = tags
+        # The tags for each union, when they aren't set explicitly
+        self._tables: Dict[Any, Mapping[Any, Type]] = {}
+
+    def __getstate__(self) -> Dict[str, Any]:
+        state = self.__dict__.copy()
+        state['_tables'] = {}
+        return state
+
+    def _get_tags(self, field_type: Type) -> Mapping[Any, Type]:
+        if self.tags is not None:
+            return self.tags
+
+        table = self._tables.get(field_type)
+        if table is None:
+            table = self._tables[field_type] = self._build_tags(field_type)
+        return table
+
+    def _build_tags(self, field_type: Type) -> Dict[Any, Type]:
+        table: Dict[Any, Type] = {}
+        for member in _union_members(field_type):
+            fields = {f.name: f for f in dataclasses.fields(member)}
+            field = fields.get(self.discriminator)
+            if field is None:
+                raise TypeError(
+                    f'{member.__name__} has no field {self.discriminator}'
+                )
+
+            if _is_literal(field.type):
+                values = field.type.__args__
+            elif field.default is not dataclasses.MISSING:
+                values = (field.default,)
+            else:
+                raise TypeError(
+                    f'{member.__name__}.{self.discriminator} must be a '
+                    'Literal or have a default value'
+                )
+
+            for value in values:
+                if value in table:
+                    raise TypeError(
+                        f'{value} is used by both {table[value].__name__} and '
+                        f'{member.__name__}'
+                    )
+                table[value] = member
+        return table
+
+    def warmup(self, field_type: Type) -> None:
+        self._get_tags(field_type)
+
+    def parse_input(self,
+                    input_value: Any,
+                    field_type: Type,
+                    path: Tuple[str, ...]) -> T:
+        if input_value is None and type(None) in field_type.__args__:
+            return None  # type: ignore
+
+        if not isinstance(input_value, Mapping):
+            raise TypeError(f'Input value: {input_value} is not a dict')
+
+        # Errors in the discriminator are raised with its name in the path,
+        # the same as errors in the other fields, so that the path of an
+        # item in a list includes its index
+        if self.discriminator not in input_value:
+            message = f'Field: {self.discriminator} missing'
+            raise PavlovaParsingError(
+                message,
+                TypeError(message),
+                path + (self.discriminator,),
+                field_type,
+            )
+
+        tag = input_value[self.discriminator]
+        tags = self._get_tags(field_type)
+        try:
+            model_class = tags.get(tag)
+        except TypeError:
+            # The tag can't be hashed, such as a list
+            model_class = None
+        if model_class is None:
+            message = f'{tag} is not a valid value for {self.discriminator}'
+            raise PavlovaParsingError(
+                message,
+                ValueError(message),
+                path + (self.discriminator,),
+                field_type,
+            )
+        return self.pavlova.from_mapping(input_value, model_class, path)
+
+
+class LiteralParser(PavlovaParser[Any]):
+    "Parses a Literal, which must be one of the Literal's values"
+
+    def parse_input(self,
+                    input_value: Any,
+                    field_type: Type,
+                    path: Tuple[str, ...]) -> Any:
+        if input_value not in field_type.__args__:
+            raise ValueError(
+                f'{input_value} is not one of {field_type.__args__}'
+            )
+        return input_value
+
+
 class EnumParser(PavlovaParser[Enum]):
-    "Parses enums"
+    """Parses enums. Strings are matched against the names of the enum
+    members, ignoring case unless case_sensitive is set, before the input is
+    matched against the values of the enum members."""
+
+    def __init__(self,
+                 pavlova_instance: BasePavlova,
+                 case_sensitive: bool = False) -> None:
+        super().__init__(pavlova_instance)
+        self.case_sensitive = case_sensitive
+        # The lookup tables for each enum, mapping names and values to their
+        # members
+        self._tables: Dict[Type[Enum], Tuple[Dict[str, Enum], Dict]] = {}
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # The tables are rebuilt after unpickling, as they may reference
+        # enums that can't be pickled
+        state = self.__dict__.copy()
+        state['_tables'] = {}
+        return state
+
+    def _get_tables(self,
+                    field_type: Type[Enum]) -> Tuple[Dict[str, Enum], Dict]:
+        tables = self._tables.get(field_type)
+        if tables is None:
+            names: Dict[str, Enum] = {}
+            values: Dict[Any, Enum] = {}
+            for member in field_type:
+                name = member.name
+                if not self.case_sensitive:
+                    name = name.lower()
+                names.setdefault(name, member)
+                try:
+                    values.setdefault(member.value, member)
+                except TypeError:
+                    # Unhashable values are left for the enum to look up
+                    pass
+            tables = self._tables[field_type] = (names, values)
+        return tables
 
     def parse_input(self,
                     input_value: Any,
                     field_type: Type,
                     path: Tuple[str, ...]) -> Enum:
+        names, values = self._get_tables(field_type)
+
         # If the input is a string, try matching it against the names of the
         # enum members. For consistency, we will lower case both values first.
         if isinstance(input_value, str):
-            enum_name = input_value.lower()
-            enum_values = [
-                m for m in field_type if m.name.lower() == enum_name
-            ]
-            if enum_values:
-                return enum_values[0]
+            name = input_value if self.case_sensitive else input_value.lower()
+            if name in names:
+                return names[name]
 
-        # Try instantiating the enum with our value
-        return field_type(input_value)
+        try:
+            return values[input_value]
+        except (KeyError, TypeError):
+            # Try instantiating the enum with our value
+            return field_type(input_value)
+
+
+class DataclassParser(PavlovaParser[Any]):
+    "Parses a nested dataclass"
+
+    def parse_input(self,
+                    input_value: Any,
+                    field_type: Type,
+                    path: Tuple[str, ...]) -> Any:
+        return self.pavlova.from_mapping(input_value, field_type, path)
 
 
 class GenericParser(PavlovaParser[T]):
@@ -199,3 +662,62 @@ class GenericParser(PavlovaParser[T]):
                     field_type: Type,
                     path: Tuple[str, ...]) -> T:
         return self.parser_type(input_value)  # type: ignore
+
+
+def _intern_key(value: Any) -> Any:
+    # Some values are equal without being interchangeable, such as
+    # Decimal('1.0') and Decimal('1'), or 0.0 and -0.0, so they are keyed by
+    # their exact representation.
+    if isinstance(value, Decimal):
+        return (Decimal, value.as_tuple())
+    if isinstance(value, float):
+        return (float, value.hex())
+    return (type(value), value)
+
+
+class InterningParser(PavlovaParser[T]):
+    """Wraps a parser so that equal values returned by it are shared, rather
+    than each being a separate object. This reduces the memory used when many
+    records contain the same values, such as status or currency codes. If the
+    parser returns a list, each of its items is shared instead.
+
+    The table of shared values holds at most maxsize values, after which new
+    values are no longer shared. Tables can be shared between parsers by
+    passing in the same table.
+    """
+
+    def __init__(self,
+                 pavlova_instance: BasePavlova,
+                 parser: PavlovaParser[T],
+                 maxsize: int = 100000,
+                 table: Optional[Dict[Any, Any]] = None) -> None:
+        super().__init__(pavlova_instance)
+        self.parser = parser
+        self.maxsize = maxsize
+        self.table: Dict[Any, Any] = {} if table is None else table
+
+    def intern(self, value: Any) -> Any:
+        "Returns the shared value that is equal to value"
+        try:
+            key = _intern_key(value)
+            return self.table[key]
+        except KeyError:
+            if len(self.table) < self.maxsize:
+                self.table[key] = value
+            return value
+        except TypeError:
+            # The value isn't hashable, so can't be shared
+            return value
+
+    def parse_input(self,
+                    input_value: Any,
+                    field_type: Type,
+                    path: Tuple[str, ...]) -> T:
+        value = self.parser.parse_input(input_value, field_type, path)
+        if isinstance(value, list):
+            intern = self.intern
+            return [intern(v) for v in value]  # type: ignore
+        return self.intern(value)
+
+    def warmup(self, field_type: Type) -> None:
+        self.parser.warmup(field_type)
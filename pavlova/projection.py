@@ -0,0 +1,143 @@
+"""Selects the fields of a dataclass, and the dataclasses nested within it,
+that are parsed by from_mapping"""
+
+from typing import (
+    Any, Dict, FrozenSet, Iterable, List, Mapping, Optional, Tuple, Type,
+    Union
+)
+
+import dataclasses
+
+from pavlova.base import BasePavlova, PavlovaParsingError
+from pavlova.parsers import PavlovaParser
+
+
+class _Unset:
+    "The type of UNSET"
+
+    def __repr__(self) -> str:
+        return 'UNSET'
+
+    def __reduce__(self) -> str:
+        return 'UNSET'
+
+
+# The value given to fields that weren't selected, and have no default
+UNSET: Any = _Unset()
+
+# The fields selected in a dataclass. Each field is paired with the fields
+# selected within it, or None if the whole field is selected.
+Projection = FrozenSet[Tuple[str, Optional['Projection']]]  # type: ignore
+
+# The fields that can be passed to from_mapping, either as a set of field
+# names, or a dictionary of field names to the fields selected within them.
+# A value of ..., True or None selects the whole field.
+FieldSpec = Union[Iterable[str], Mapping[str, Any]]
+
+
+def normalize(spec: FieldSpec) -> Projection:
+    "Converts a spec into a Projection, which can be used as a key"
+    if isinstance(spec, str):
+        raise TypeError(f'Expected a set of field names, not {spec!r}')
+    if isinstance(spec, Mapping):
+        return frozenset(
+            (name, None if value in (..., True, None) else normalize(value))
+            for name, value in spec.items()
+        )
+    return frozenset((name, None) for name in spec)
+
+
+def check_fields(model_class: Type, projection: Projection) -> None:
+    "Raises a ValueError if a projection selects a field that doesn't exist"
+    names = {field.name for field in dataclasses.fields(model_class)}
+    for name, _ in projection:
+        if name not in names:
+            raise ValueError(
+                f'{model_class.__name__} does not have a field {name!r}'
+            )
+
+
+def check_type(field_type: Type) -> None:
+    """Raises a ValueError if fields can't be selected within a type, which
+    must be a dataclass, or a list, dictionary or Optional of one"""
+    origin = getattr(field_type, '__origin__', None)
+    if dataclasses.is_dataclass(field_type):
+        return
+    if origin in (list, List):
+        check_type(field_type.__args__[0])
+        return
+    if origin in (dict, Dict):
+        check_type(field_type.__args__[1])
+        return
+    if origin is Union:
+        # pylint: disable=unidiomatic-typecheck
+        members = [
+            member for member in field_type.__args__
+            if member is not type(None)
+        ]
+        if len(members) == 1:
+            check_type(members[0])
+            return
+    raise ValueError(f'Fields can not be selected within {field_type}')
+
+
+class ProjectionParser(PavlovaParser[Any]):
+    """Parses the dataclasses within a field, or within the lists,
+    dictionaries and Optionals of a field, using a projection"""
+
+    def __init__(self,
+                 pavlova_instance: BasePavlova,
+                 projection: Projection,
+                 exclude: bool) -> None:
+        super().__init__(pavlova_instance)
+        self.projection = projection
+        self.exclude = exclude
+
+    def parse_input(self,
+                    input_value: Any,
+                    field_type: Type,
+                    path: Tuple[str, ...]) -> Any:
+        # pylint: disable=protected-access,too-many-locals
+        if dataclasses.is_dataclass(field_type):
+            return self.pavlova._from_projection(  # type: ignore
+                input_value, field_type, path, self.projection, self.exclude,
+            )
+
+        origin = getattr(field_type, '__origin__', None)
+        if origin is Union:
+            if input_value is None:
+                return None
+            # pylint: disable=unidiomatic-typecheck
+            member = next(
+                member for member in field_type.__args__
+                if member is not type(None)
+            )
+            return self.parse_input(input_value, member, path)
+
+        if origin in (list, List):
+            if not isinstance(input_value, list):
+                raise TypeError(f'Input value: {input_value} is not a list')
+            sub_type = field_type.__args__[0]
+            values = []
+            index = 0
+            try:
+                for index, item in enumerate(input_value):
+                    values.append(self.parse_input(item, sub_type, path))
+            except PavlovaParsingError as exc:
+                exc.insert_path(path, f'[{index}]')
+                raise
+            return values
+
+        if not isinstance(input_value, dict):
+            raise TypeError(f'Input value: {input_value} is not a dict')
+        key_type, value_type = field_type.__args__
+        parse_field = self.pavlova.parse_field
+        parsed = {}
+        for key, value in input_value.items():
+            parsed_key = parse_field(key, key_type, path)
+            try:
+                parsed[parsed_key] = self.parse_input(value, value_type, path)
+            except PavlovaParsingError as exc:
+                exc.insert_path(path, key)
+                raise
+        return parsed
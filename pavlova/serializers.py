@@ -0,0 +1,140 @@
+#pylint: disable=too-few-public-methods,missing-docstring
+#pylint: disable=unused-argument,no-self-use
+"""This module contains all of the built in serializers for Pavlova, which
+convert parsed values back into values that can be encoded as JSON"""
+
+from abc import ABC, abstractmethod
+import array
+import dataclasses
+import datetime
+from decimal import Decimal
+from enum import Enum
+from typing import Any, Dict, List, Type, TypeVar, Generic
+
+from pavlova.base import BasePavlova
+
+
+T = TypeVar('T')  # pylint: disable=invalid-name
+
+
+class PavlovaSerializer(Generic[T], ABC):
+    "The base pavlova serializer for types"
+
+    def __init__(self, pavlova_instance: BasePavlova) -> None:
+        self.pavlova = pavlova_instance
+
+    @abstractmethod
+    def serialize(self, value: T, field_type: Type) -> Any:
+        "Given a typed value, return a value that can be encoded as JSON"
+        pass
+
+
+class IdentitySerializer(PavlovaSerializer[Any]):
+    """Returns values that can already be encoded as JSON, such as strings
+    and numbers, as they are. Fields that use this serializer are copied
+    without calling it."""
+
+    def serialize(self, value: Any, field_type: Type) -> Any:
+        return value
+
+
+class DatetimeSerializer(PavlovaSerializer[datetime.datetime]):
+    "Serializes datetimes as ISO 8601 strings"
+
+    def serialize(self, value: datetime.datetime, field_type: Type) -> str:
+        return value.isoformat()
+
+
+class DecimalSerializer(PavlovaSerializer[Decimal]):
+    "Serializes decimals as strings, so that no precision is lost"
+
+    def serialize(self, value: Decimal, field_type: Type) -> str:
+        return str(value)
+
+
+class EnumSerializer(PavlovaSerializer[Enum]):
+    """Serializes enums as the name of the member, or as its value if
+    use_value is set. Both are understood by the EnumParser."""
+
+    def __init__(self,
+                 pavlova_instance: BasePavlova,
+                 use_value: bool = False) -> None:
+        super().__init__(pavlova_instance)
+        self.use_value = use_value
+
+    def serialize(self, value: Enum, field_type: Type) -> Any:
+        if self.use_value:
+            return value.value
+        return value.name
+
+
+class ArraySerializer(PavlovaSerializer[array.array]):
+    "Serializes arrays as lists"
+
+    def serialize(self, value: array.array, field_type: Type) -> List:
+        return value.tolist()
+
+
+def _is_identity_type(pavlova_instance: BasePavlova, sub_type: Any) -> bool:
+    "Whether values of sub_type are returned as they are when serialized"
+    # Only types that are registered directly are checked, as subclasses of
+    # these types, such as enums, may need to be serialized
+    return type(  # pylint: disable=unidiomatic-typecheck
+        pavlova_instance.serializers.get(sub_type)
+    ) is IdentitySerializer
+
+
+class ListSerializer(PavlovaSerializer[List[T]]):
+    "Serializes a List"
+
+    def serialize(self, value: List[T], field_type: Type) -> List:
+        sub_type = field_type.__args__[0]
+        if _is_identity_type(self.pavlova, sub_type):
+            return list(value)
+
+        serialize_field = self.pavlova.serialize_field
+        return [serialize_field(item, sub_type) for item in value]
+
+
+class DictSerializer(PavlovaSerializer[Dict]):
+    "Serializes a Dict"
+
+    def serialize(self, value: Dict, field_type: Type) -> Dict:
+        key_type, value_type = field_type.__args__
+        if (_is_identity_type(self.pavlova, key_type)
+                and _is_identity_type(self.pavlova, value_type)):
+            return dict(value)
+
+        serialize_field = self.pavlova.serialize_field
+        return {
+            serialize_field(key, key_type): serialize_field(item, value_type)
+            for key, item in value.items()
+        }
+
+
+class UnionSerializer(PavlovaSerializer[Any]):
+    """Serializes Optional types, and unions of dataclasses. The members of
+    other unions are serialized according to the type of the value."""
+
+    def serialize(self, value: Any, field_type: Type) -> Any:
+        if value is None:
+            return None
+
+        if dataclasses.is_dataclass(value):
+            return self.pavlova.to_mapping(value)
+
+        # pylint: disable=unidiomatic-typecheck
+        members = [
+            member for member in field_type.__args__
+            if member is not type(None)
+        ]
+        if len(members) == 1:
+            return self.pavlova.serialize_field(value, members[0])
+        return self.pavlova.serialize_field(value, type(value))
+
+
+class DataclassSerializer(PavlovaSerializer[Any]):
+    "Serializes a nested dataclass by calling to_mapping recursively"
+
+    def serialize(self, value: Any, field_type: Type) -> Dict[str, Any]:
+        return self.pavlova.to_mapping(value)
@@ -0,0 +1,219 @@
+"Reads records from files and streams, without loading them into memory"
+
+import codecs
+import json
+import mmap
+import os
+import re
+from typing import IO, Any, Iterator, List, Optional, Union
+
+
+# The type of the files that can be read, either a path or an open file
+FileOrPath = Union[str, 'os.PathLike[str]', IO]
+
+# Read files in large chunks, as the records are usually small
+DEFAULT_BUFFER_SIZE = 1024 * 1024
+
+# The number of bytes read at a time when decoding a JSON array from a stream
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+_WHITESPACE = ' \t\n\r'
+
+# Matches everything within an array or object up to the next bracket,
+# which is every string, number, true, false and null, and the whitespace,
+# commas and colons between them. Any other character stops the match.
+_SKIP = re.compile(
+    r'(?:[ \t\n\r,:0-9eE.+\-truefalsn]+|"[^"\\]*(?:\\.[^"\\]*)*")*'
+)
+# Matches the rest of a string, after its opening quote, up to the closing
+# quote, or the end of the buffer
+_STRING_BODY = re.compile(r'[^"\\]*(?:\\.[^"\\]*)*')
+# Matches the end of a number, true, false or null
+_SCALAR_END = re.compile(r'[ \t\n\r,\]]')
+_CLOSING = {'[': ']', '{': '}'}
+
+
+def iter_lines(file_or_path: FileOrPath,
+               buffer_size: int = DEFAULT_BUFFER_SIZE,
+               use_mmap: bool = False) -> Iterator[Union[str, bytes]]:
+    """Lazily yields each line of a file. If file_or_path is a path, the file
+    is opened in binary mode with the given buffer size, or memory mapped if
+    use_mmap is set. Open files are read as they are, and aren't closed."""
+    if not isinstance(file_or_path, (str, os.PathLike)):
+        yield from _iter_file_lines(file_or_path, use_mmap)
+        return
+
+    with open(file_or_path, 'rb', buffering=buffer_size) as file:
+        yield from _iter_file_lines(file, use_mmap)
+
+
+def _iter_file_lines(file: IO, use_mmap: bool) -> Iterator[Union[str, bytes]]:
+    if not use_mmap:
+        yield from file
+        return
+
+    # mmap can't map an empty file
+    if os.fstat(file.fileno()).st_size == 0:
+        return
+
+    with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        yield from iter(mapped.readline, b'')
+
+
+class _JsonArrayReader:
+    "Incrementally decodes the items of a JSON array from a binary stream"
+    # pylint: disable=too-many-instance-attributes
+
+    def __init__(self, stream: IO[bytes], chunk_size: int) -> None:
+        self.stream = stream
+        self.chunk_size = chunk_size
+        self.decoder = json.JSONDecoder()
+        self.text_decoder = codecs.getincrementaldecoder('utf-8')()
+        self.buffer = ''
+        self.position = 0
+        self.finished = False
+        # How far the value at position has been scanned for its end, and
+        # the state of the scan at that point
+        self.scanned = 0
+        self.closing: List[str] = []
+        self.in_string = False
+
+    def read(self) -> bool:
+        "Reads the next chunk into the buffer, returning False at the end"
+        if self.finished:
+            return False
+
+        chunk = self.stream.read(self.chunk_size)
+        self.finished = not chunk
+        # Discard everything that has already been decoded
+        self.buffer = self.buffer[self.position:] + self.text_decoder.decode(
+            chunk, final=self.finished,
+        )
+        self.position = 0
+        return bool(chunk) or bool(self.buffer)
+
+    def next_character(self) -> str:
+        "Skips whitespace and returns the next character, or '' at the end"
+        while True:
+            while (self.position < len(self.buffer)
+                   and self.buffer[self.position] in _WHITESPACE):
+                self.position += 1
+            if self.position < len(self.buffer):
+                return self.buffer[self.position]
+            if not self.read():
+                return ''
+
+    def expect(self, characters: str) -> str:
+        "Consumes the next character, which must be one of characters"
+        character = self.next_character()
+        if not character or character not in characters:
+            raise json.JSONDecodeError(
+                f'Expecting one of {characters!r}', self.buffer, self.position,
+            )
+        self.position += 1
+        return character
+
+    def next_value(self) -> Any:
+        """Decodes the value at the current position. The end of the value
+        is found first, so that it is only decoded once, however many
+        chunks it is split across."""
+        if not self.next_character():
+            raise json.JSONDecodeError(
+                'Expecting value', self.buffer, self.position,
+            )
+        self.find_end()
+        value, self.position = self.decoder.raw_decode(
+            self.buffer, self.position,
+        )
+        return value
+
+    def find_end(self) -> int:
+        """Returns the end of the value at the current position, reading
+        chunks until it is complete. Each character is only scanned once,
+        and characters that can't appear in the value raise an error
+        straight away, rather than after reading the rest of the stream."""
+        if self.buffer[self.position] not in '"[{':
+            # Numbers, true, false and null are short, so are scanned from
+            # the start each time a chunk is read
+            while True:
+                match = _SCALAR_END.search(self.buffer, self.position)
+                if match is not None:
+                    return match.start()
+                if not self.read():
+                    return len(self.buffer)
+
+        character = self.buffer[self.position]
+        self.in_string = character == '"'
+        self.closing = [] if self.in_string else [_CLOSING[character]]
+        self.scanned = 1
+        while True:
+            end = self.scan()
+            if end is not None:
+                return end
+            if not self.read():
+                # The value is incomplete, which raw_decode reports
+                return len(self.buffer)
+
+    def scan(self) -> Optional[int]:
+        """Scans the buffer from where the last scan stopped, returning the
+        end of the value, or None if it continues into the next chunk"""
+        buffer = self.buffer
+        closing = self.closing
+        index = self.position + self.scanned
+        while True:
+            if self.in_string:
+                index = _STRING_BODY.match(buffer, index).end()  # type: ignore
+                # Stops before a backslash at the end of the buffer, as the
+                # escaped character is in the next chunk
+                if index == len(buffer) or buffer[index] == '\\':
+                    break
+                index += 1
+                self.in_string = False
+                if not closing:
+                    return index
+
+            index = _SKIP.match(buffer, index).end()  # type: ignore
+            if index == len(buffer):
+                break
+            character = buffer[index]
+            if character == '"':
+                # A string that continues into the next chunk
+                self.in_string = True
+            elif character in _CLOSING:
+                closing.append(_CLOSING[character])
+            elif character not in ']}':
+                raise json.JSONDecodeError('Expecting value', buffer, index)
+            elif closing.pop() != character:
+                raise json.JSONDecodeError(
+                    f'Unexpected {character!r}', buffer, index,
+                )
+            index += 1
+            if not closing:
+                return index
+
+        self.scanned = index - self.position
+        return None
+
+    def __iter__(self) -> Iterator[Any]:
+        self.expect('[')
+        if self.next_character() == ']':
+            self.position += 1
+        else:
+            while True:
+                yield self.next_value()
+                if self.expect(',]') == ']':
+                    break
+
+        if self.next_character():
+            raise json.JSONDecodeError(
+                'Extra data', self.buffer, self.position,
+            )
+
+
+def iter_json_array(stream: IO[bytes],
+                    chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[Any]:
+    """Lazily yields each item of a JSON array read from a UTF-8 encoded
+    binary stream, reading chunk_size bytes at a time, so that only a single
+    item needs to be held in memory. Raises a json.JSONDecodeError if the
+    stream isn't a valid JSON array."""
+    return iter(_JsonArrayReader(stream, chunk_size))
@@ -0,0 +1,98 @@
+"Records where the time is spent when parsing with Pavlova"
+
+from time import perf_counter
+from typing import Any, Dict, List, Tuple, Type, TypeVar
+
+from pavlova.base import BasePavlova
+from pavlova.parsers import PavlovaParser
+
+
+T = TypeVar('T')  # pylint: disable=invalid-name
+
+
+class TraceStats:
+    "The number of calls to, and total time spent in, a parser or a field"
+    # pylint: disable=too-few-public-methods
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.seconds = 0.0
+
+    def record(self, seconds: float) -> None:
+        "Records a single call that took the given number of seconds"
+        self.calls += 1
+        self.seconds += seconds
+
+
+class Tracer:
+    """Collects the statistics for each parser class, and each dataclass
+    field, while it is installed with Pavlova.trace"""
+
+    def __init__(self) -> None:
+        # Keyed by the name of the parser class
+        self.parsers: Dict[str, TraceStats] = {}
+        # Keyed by the dataclass name and field name, e.g. 'Sample.date'
+        self.fields: Dict[str, TraceStats] = {}
+
+    def wrap_parser(self, parser: PavlovaParser) -> PavlovaParser:
+        "Returns a parser that records the statistics for parser's class"
+        name = type(parser).__name__
+        stats = self.parsers.setdefault(name, TraceStats())
+        return TracingParser(parser.pavlova, parser, stats)
+
+    def wrap_field(self,
+                   parser: PavlovaParser,
+                   model_class: Type,
+                   field_name: str) -> PavlovaParser:
+        "Returns a parser that records the statistics for a dataclass field"
+        name = f'{model_class.__qualname__}.{field_name}'
+        stats = self.fields.setdefault(name, TraceStats())
+        return TracingParser(parser.pavlova, parser, stats)
+
+    def report(self) -> str:
+        """Returns a table of the parsers, followed by a table of the fields,
+        with the most time consuming first. As parsers are timed including
+        any parsers they call, nested types are counted more than once."""
+        lines: List[str] = []
+        for title, stats in (('parser', self.parsers),
+                             ('field', self.fields)):
+            lines.append(
+                f'{title:<40} {"calls":>10} {"total ms":>12} '
+                f'{"per call us":>12}'
+            )
+            ordered: List[Tuple[str, TraceStats]] = sorted(
+                stats.items(), key=lambda item: item[1].seconds, reverse=True,
+            )
+            for name, stat in ordered:
+                per_call = stat.seconds / stat.calls * 1e6 if stat.calls else 0
+                lines.append(
+                    f'{name:<40} {stat.calls:>10} '
+                    f'{stat.seconds * 1e3:>12.3f} {per_call:>12.2f}'
+                )
+            lines.append('')
+        return '\n'.join(lines)
+
+
+class TracingParser(PavlovaParser[T]):
+    "Wraps a parser, recording the time spent in each call to it"
+
+    def __init__(self,
+                 pavlova_instance: BasePavlova,
+                 parser: PavlovaParser[T],
+                 stats: TraceStats) -> None:
+        super().__init__(pavlova_instance)
+        self.parser = parser
+        self.stats = stats
+
+    def parse_input(self,
+                    input_value: Any,
+                    field_type: Type,
+                    path: Tuple[str, ...]) -> T:
+        start = perf_counter()
+        try:
+            return self.parser.parse_input(input_value, field_type, path)
+        finally:
+            self.stats.record(perf_counter() - start)
+
+    def warmup(self, field_type: Type) -> None:
+        self.parser.warmup(field_type)
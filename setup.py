@@ -17,7 +17,10 @@ setup(
     author_email='chris@freelancer.com',
     url='https://github.com/freelancer/pavlova',
     packages=find_packages(
-        exclude=["*.tests", "*.tests.*", "tests.*", "tests"]
+        exclude=[
+            "*.tests", "*.tests.*", "tests.*", "tests",
+            "benchmarks.*", "benchmarks",
+        ]
     ),
     install_requires=requirements,
     classifiers=[
@@ -0,0 +1,167 @@
+# pylint: disable=missing-docstring,too-few-public-methods
+
+import unittest
+from typing import Dict, List, Optional, Set, Union
+
+from dataclasses import dataclass, make_dataclass
+
+from pavlova import Pavlova, PavlovaParsingError
+from pavlova.cache import MISSING, ResultCache, structural_key
+from pavlova.parsers import GenericParser
+
+
+@dataclass(frozen=True)
+class Flag:
+    name: str
+    enabled: bool
+
+
+@dataclass(frozen=True)
+class Flags:
+    flags: List[Flag]
+
+
+@dataclass(frozen=True)
+class Feature:
+    flag: Flag
+    fallback: Optional[Flag] = None
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestStructuralKey(unittest.TestCase):
+    def test_equal_mappings(self) -> None:
+        self.assertEqual(
+            structural_key({'a': [1, {'b': 'c'}], 'd': None}),
+            structural_key({'d': None, 'a': [1, {'b': 'c'}]}),
+        )
+
+    def test_types_are_distinguished(self) -> None:
+        keys = {
+            structural_key({'a': value}) for value in (1, 1.0, True, '1')
+        }
+        self.assertEqual(len(keys), 4)
+
+    def test_unhashable_values(self) -> None:
+        with self.assertRaises(TypeError):
+            hash(structural_key({'a': {'b', 'c'}}))
+
+
+class TestResultCache(unittest.TestCase):
+    def test_evicts_least_recently_used(self) -> None:
+        cache = ResultCache(maxsize=2)
+        cache.put('a', 1)
+        cache.put('b', 2)
+        self.assertEqual(cache.get('a'), 1)
+        cache.put('c', 3)
+
+        self.assertIs(cache.get('b'), MISSING)
+        self.assertEqual(cache.get('a'), 1)
+        self.assertEqual(cache.get('c'), 3)
+        self.assertEqual((cache.hits, cache.misses), (3, 1))
+
+    def test_expires_after_ttl(self) -> None:
+        clock = FakeClock()
+        cache = ResultCache(ttl=10, clock=clock)
+        cache.put('a', 1)
+
+        clock.now = 10
+        self.assertEqual(cache.get('a'), 1)
+        clock.now = 10.5
+        self.assertIs(cache.get('a'), MISSING)
+        self.assertEqual(len(cache), 0)
+
+
+class TestCacheResults(unittest.TestCase):
+    mapping = {'flag': {'name': 'dark mode', 'enabled': 'yes'}}
+
+    def test_returns_cached_instance(self) -> None:
+        pavlova = Pavlova()
+        cache = pavlova.cache_results(Feature)
+
+        first = pavlova.from_mapping(self.mapping, Feature)
+        second = pavlova.from_mapping(
+            {'flag': {'enabled': 'yes', 'name': 'dark mode'}}, Feature,
+        )
+        self.assertIs(first, second)
+        self.assertEqual(first, Feature(Flag('dark mode', True)))
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+
+        third = pavlova.from_mapping(
+            {'flag': {'name': 'beta', 'enabled': 'no'}}, Feature,
+        )
+        self.assertEqual(third, Feature(Flag('beta', False)))
+        self.assertEqual(cache.misses, 2)
+
+    def test_parsing_many_mappings_uses_cache(self) -> None:
+        pavlova = Pavlova()
+        cache = pavlova.cache_results(Flag)
+        mapping = {'name': 'a', 'enabled': 1}
+
+        parsed = pavlova.from_mappings([mapping] * 3, Flag)
+        self.assertIs(parsed[0], parsed[2])
+        self.assertIs(pavlova.from_json_array(b'[{"name": "a", '
+                                              b'"enabled": 1}]', Flag)[0],
+                      parsed[0])
+        self.assertEqual((cache.hits, cache.misses), (3, 1))
+
+    def test_requires_immutable_fields(self) -> None:
+        @dataclass
+        class NotFrozen:
+            name: str
+
+        for field_type in (
+                List[str], Dict[str, int], Set[str], Optional[List[str]],
+                Union[Flag, Flags], NotFrozen, Optional[NotFrozen], Flags,
+        ):
+            model_class = make_dataclass(
+                'Mutable', [('value', field_type)], frozen=True,
+            )
+            with self.assertRaises(TypeError):
+                Pavlova().cache_results(model_class)
+
+        # Frozen dataclasses, and Optionals of them, can be shared
+        Pavlova().cache_results(Feature)
+
+    def test_caches_nested_dataclasses(self) -> None:
+        pavlova = Pavlova()
+        cache = pavlova.cache_results(Flag)
+        parsed = pavlova.from_mapping(
+            {'flags': [{'name': 'a', 'enabled': 1}] * 3}, Flags,
+        )
+        self.assertIs(parsed.flags[0], parsed.flags[2])
+        self.assertEqual((cache.hits, cache.misses), (2, 1))
+
+    def test_errors_are_not_cached(self) -> None:
+        pavlova = Pavlova()
+        cache = pavlova.cache_results(Flag)
+        for _ in range(2):
+            with self.assertRaises(PavlovaParsingError):
+                pavlova.from_mapping({'name': 'a'}, Flag)
+        self.assertEqual(len(cache), 0)
+
+    def test_register_parser_clears_cache(self) -> None:
+        pavlova = Pavlova()
+        cache = pavlova.cache_results(Feature)
+        pavlova.from_mapping(self.mapping, Feature)
+
+        pavlova.register_parser(str, GenericParser(pavlova, str.upper))
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(
+            pavlova.from_mapping(self.mapping, Feature).flag.name,
+            'DARK MODE',
+        )
+
+    def test_requires_frozen_dataclass(self) -> None:
+        @dataclass
+        class Mutable:
+            name: str
+
+        with self.assertRaises(TypeError):
+            Pavlova().cache_results(Mutable)
@@ -0,0 +1,87 @@
+# pylint: disable=missing-docstring
+
+import unittest
+from typing import List
+
+from dataclasses import dataclass
+
+from pavlova.decoders import (
+    UNTYPED, JsonDecoder, MsgspecDecoder, default_decoder, get_decoder
+)
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+@dataclass
+class Point:
+    x: int
+    y: int
+
+
+class TestJsonDecoder(unittest.TestCase):
+    def test_decode(self) -> None:
+        decoder = JsonDecoder()
+        for data in ('{"x": 1}', b'{"x": 1}', memoryview(b'{"x": 1}')):
+            self.assertEqual(decoder.decode(data), {'x': 1})
+
+    def test_invalid_json(self) -> None:
+        with self.assertRaises(ValueError):
+            JsonDecoder().decode(b'{')
+
+    def test_decode_typed_is_unsupported(self) -> None:
+        self.assertIs(JsonDecoder().decode_typed(b'{}', Point), UNTYPED)
+
+    def test_default_decoder(self) -> None:
+        self.assertIs(default_decoder(), default_decoder())
+        self.assertEqual(default_decoder().name, 'json')
+        # Integers larger than 64 bits keep their precision
+        self.assertEqual(
+            default_decoder().decode(b'[123456789012345678901234567890]'),
+            [123456789012345678901234567890],
+        )
+
+    def test_get_decoder(self) -> None:
+        self.assertEqual(get_decoder('json').name, 'json')
+        with self.assertRaises(ValueError):
+            get_decoder('yaml')
+
+    @unittest.skipUnless(orjson, 'orjson is not installed')
+    def test_orjson(self) -> None:
+        decoder = get_decoder('orjson')
+        self.assertEqual(decoder.name, 'orjson')
+        self.assertEqual(decoder.decode(memoryview(b'[1, 2]')), [1, 2])
+        with self.assertRaises(ValueError):
+            decoder.decode(b'{')
+
+
+@unittest.skipUnless(msgspec, 'msgspec is not installed')
+class TestMsgspecDecoder(unittest.TestCase):
+    def test_decode(self) -> None:
+        decoder = MsgspecDecoder()
+        self.assertEqual(decoder.decode(b'{"x": 1}'), {'x': 1})
+        self.assertIs(decoder.decode_typed(b'{"x": 1}', Point), UNTYPED)
+        with self.assertRaises(ValueError):
+            decoder.decode(b'{')
+
+    def test_decode_typed(self) -> None:
+        decoder = MsgspecDecoder(typed=True)
+        self.assertEqual(
+            decoder.decode_typed(b'{"x": 1, "y": 2}', Point), Point(1, 2),
+        )
+        self.assertEqual(
+            decoder.decode_typed(b'[{"x": 1, "y": 2}]', List[Point]),
+            [Point(1, 2)],
+        )
+        # Values that need to be parsed are left to Pavlova
+        self.assertIs(
+            decoder.decode_typed(b'{"x": "1", "y": 2}', Point), UNTYPED,
+        )
+        self.assertIs(decoder.decode_typed(b'{', Point), UNTYPED)
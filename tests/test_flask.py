@@ -1,11 +1,15 @@
 # pylint: disable=missing-docstring
 
+import json
 import unittest
-from typing import Optional
+from typing import Any, Iterator, List, Optional, Type
 
+import flask
 from flask import Flask
 from dataclasses import dataclass
 
+from pavlova import PavlovaParsingError
+from pavlova.decoders import JsonDecoder
 from pavlova.flask import FlaskPavlova
 
 
@@ -73,3 +77,203 @@ class TestFlaskPavlova(unittest.TestCase):
         self.assertTrue(isinstance(self.input_sample, InputSample))
         self.assertEqual(self.input_sample.id, 10)
         self.assertEqual(self.input_sample.category, 'doggo')
+
+    def test_args_take_precedence(self) -> None:
+        with self.app.test_client() as client:
+            client.post('/?id=10', json={'id': 20, 'category': 'doggo'})
+
+        assert self.input_sample is not None
+        self.assertEqual(self.input_sample.id, 10)
+        self.assertEqual(self.input_sample.category, 'doggo')
+
+        with self.app.test_client() as client:
+            client.post('/?id=10', data={'id': 20, 'category': 'doggo'})
+
+        assert self.input_sample is not None
+        self.assertEqual(self.input_sample.id, 10)
+        self.assertEqual(self.input_sample.category, 'doggo')
+
+    def test_invalid_json_is_bad_request(self) -> None:
+        with self.app.test_client() as client:
+            response = client.post(
+                '/', data='{', content_type='application/json',
+            )
+
+        self.assertEqual(response.status_code, 400)
+        self.assertIsNone(self.input_sample)
+
+    def test_endpoint_can_read_json_body(self) -> None:
+        bodies: List[Any] = []
+
+        @self.pavlova.use(InputSample)
+        def read(_input_sample: InputSample) -> str:
+            bodies.append(flask.request.get_json())
+            return 'read'
+
+        self.app.route('/read', methods=['POST'])(read)
+        with self.app.test_client() as client:
+            response = client.post('/read', json={'id': 10, 'category': 'a'})
+            client.post('/read?id=5', json={'category': 'b'})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            bodies, [{'id': 10, 'category': 'a'}, {'category': 'b'}],
+        )
+
+    def test_custom_json_loads(self) -> None:
+        bodies: List[bytes] = []
+
+        def json_loads(data: bytes) -> Any:
+            bodies.append(data)
+            return json.loads(data)
+
+        pavlova = FlaskPavlova(json_loads=json_loads)
+
+        @pavlova.use(InputSample)
+        def custom(input_sample: InputSample) -> str:
+            self.input_sample = input_sample
+            return 'custom'
+
+        self.app.route('/custom', methods=['POST'])(custom)
+        with self.app.test_client() as client:
+            client.post('/custom', json={'id': 10, 'category': 'doggo'})
+
+        self.assertEqual(self.input_sample, InputSample(10, 'doggo'))
+        self.assertEqual(len(bodies), 1)
+
+    def test_json_body_is_decoded_like_from_json(self) -> None:
+        class TypedDecoder(JsonDecoder):
+            def decode_typed(self, data: Any, model_type: Type) -> Any:
+                return InputSample(1, 'typed')
+
+        pavlova = FlaskPavlova(trusted=True)
+        pavlova.json_decoder = TypedDecoder()
+
+        @pavlova.use(InputSample)
+        def typed(input_sample: InputSample) -> str:
+            self.input_sample = input_sample
+            return 'typed'
+
+        self.app.route('/typed', methods=['POST'])(typed)
+        with self.app.test_client() as client:
+            client.post('/typed', json={'id': 10, 'category': 'doggo'})
+            self.assertEqual(self.input_sample, InputSample(1, 'typed'))
+
+            # The query string is also parsed, so the body is decoded into a
+            # dictionary
+            client.post('/typed?id=5', json={'category': 'doggo'})
+            self.assertEqual(self.input_sample, InputSample(5, 'doggo'))
+
+            response = client.post(
+                '/typed?id=5', data='{', content_type='application/json',
+            )
+            self.assertEqual(response.status_code, 400)
+
+    def test_use_eager_resolves_parsers(self) -> None:
+        pavlova = FlaskPavlova()
+        pavlova.use(InputSample, eager=True)
+
+        self.assertIn(
+            InputSample,
+            pavlova._snapshot.plans,  # pylint: disable=protected-access
+        )
+
+
+    def test_returns_dataclasses_as_json(self) -> None:
+        @self.pavlova.use(InputSample)
+        def echo(input_sample: InputSample) -> Any:
+            return input_sample, 201
+
+        @self.pavlova.use(InputSample)
+        def repeat(input_sample: InputSample) -> Any:
+            return [input_sample, input_sample]
+
+        self.app.route('/echo', methods=['POST'])(echo)
+        self.app.route('/repeat', methods=['POST'])(repeat)
+        sample = {'id': 10, 'category': 'doggo'}
+        with self.app.test_client() as client:
+            echo_response = client.post('/echo', json=sample)
+            repeat_response = client.post('/repeat', json=sample)
+
+        self.assertEqual(echo_response.status_code, 201)
+        self.assertEqual(echo_response.get_json(), sample)
+        self.assertEqual(repeat_response.get_json(), [sample, sample])
+
+
+class TestFlaskPavlovaCache(unittest.TestCase):
+    def test_repeated_query_strings_are_cached(self) -> None:
+        @dataclass(frozen=True)
+        class Query:
+            id: int
+            category: str
+
+        app = Flask(__name__)
+        pavlova = FlaskPavlova()
+        cache = pavlova.cache_results(Query)
+        queries: List[Query] = []
+
+        @app.route('/')
+        @pavlova.use(Query)
+        def index(query: Query) -> str:
+            queries.append(query)
+            return 'index'
+
+        with app.test_client() as client:
+            client.get('/?id=10&category=doggo')
+            client.get('/?category=doggo&id=10')
+
+        self.assertIs(queries[0], queries[1])
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+
+
+class TestFlaskPavlovaList(unittest.TestCase):
+    def setUp(self) -> None:
+        self.app = Flask(__name__)
+        self.pavlova = FlaskPavlova()
+        self.pavlova.stream_chunk_size = 8
+        self.parsed: List[InputSample] = []
+        self.error: Optional[PavlovaParsingError] = None
+
+        @self.pavlova.use(List[InputSample])
+        def index(input_samples: Iterator[InputSample]) -> str:
+            try:
+                for input_sample in input_samples:
+                    self.parsed.append(input_sample)
+            except PavlovaParsingError as exc:
+                self.error = exc
+            return 'index'
+
+        self.app.route('/', methods=['POST'])(index)
+
+    def test_parses_items(self) -> None:
+        samples = [{'id': i, 'category': f'doggo {i}'} for i in range(20)]
+        with self.app.test_client() as client:
+            client.post('/', json=samples)
+
+        self.assertEqual(self.parsed, [
+            InputSample(i, f'doggo {i}') for i in range(20)
+        ])
+
+    def test_error_includes_index(self) -> None:
+        samples = [
+            {'id': 1, 'category': 'doggo'},
+            {'id': 'two', 'category': 'doggo'},
+        ]
+        with self.app.test_client() as client:
+            client.post('/', json=samples)
+
+        self.assertEqual(self.parsed, [InputSample(1, 'doggo')])
+        assert self.error is not None
+        self.assertEqual(self.error.path, ('[1]', 'id'))
+
+    def test_invalid_json_is_bad_request(self) -> None:
+        for body in ('{"id": 1}', '[{"id": 1, "category": "a"}, 1]', '[{'):
+            with self.app.test_client() as client:
+                response = client.post(
+                    '/', data=body, content_type='application/json',
+                )
+            self.assertEqual(response.status_code, 400)
+
+    def test_requires_list_of_dataclasses(self) -> None:
+        with self.assertRaises(TypeError):
+            self.pavlova.use(List[int])
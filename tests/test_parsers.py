@@ -1,16 +1,25 @@
 # pylint: disable=missing-docstring
 
-from datetime import datetime
+from array import array
+from datetime import date, datetime, timezone
 from decimal import Decimal
 from enum import Enum, auto
 import unittest
+from unittest import mock
 from typing import List, Dict, Union, Optional
 
-from pavlova import Pavlova
+from dataclasses import dataclass
+
+from pavlova import Pavlova, PavlovaParsingError
 import pavlova.parsers
 from pavlova.parsers import PavlovaParser
 from tests import Email
 
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
 
 class TestBoolParser(unittest.TestCase):
     def test_truthy_string_values(self) -> None:
@@ -72,6 +81,72 @@ class TestListParser(unittest.TestCase):
             parser.parse_input([0, 1, 'a'], List[bool], tuple())
 
 
+    def test_converts_primitive_lists(self) -> None:
+        parser: PavlovaParser = pavlova.parsers.ListParser(Pavlova())
+
+        values = parser.parse_input(['1', 2, 3.5, True], List[int], tuple())
+        self.assertEqual(values, [1, 2, 3, 1])
+        self.assertEqual([type(v) for v in values], [int] * 4)
+
+        values = parser.parse_input([1, '2.5'], List[Decimal], tuple())
+        self.assertEqual(values, [Decimal(1), Decimal('2.5')])
+
+        with self.assertRaises(ValueError):
+            parser.parse_input(['1', 'a'], List[float], tuple())
+
+    def test_reuses_items_with_exact_type(self) -> None:
+        parser: PavlovaParser = pavlova.parsers.ListParser(Pavlova())
+
+        input_value = ['a', 'b']
+        values = parser.parse_input(input_value, List[str], tuple())
+        self.assertEqual(values, input_value)
+        self.assertIsNot(values, input_value)
+        self.assertIs(values[0], input_value[0])
+
+    def test_uses_registered_parser_for_items(self) -> None:
+        instance = Pavlova()
+        instance.register_parser(str, pavlova.parsers.GenericParser(
+            instance, Email,
+        ))
+        parser: PavlovaParser = pavlova.parsers.ListParser(instance)
+
+        with self.assertRaises(ValueError):
+            parser.parse_input(['chris'], List[str], tuple())
+
+
+class TestArrayParser(unittest.TestCase):
+    def test_parses_array(self) -> None:
+        parser: PavlovaParser = pavlova.parsers.ArrayParser(Pavlova())
+
+        value = parser.parse_input([1, '2.5'], array, tuple())
+        self.assertEqual(value, array('d', [1.0, 2.5]))
+
+    def test_typecode(self) -> None:
+        parser: PavlovaParser = pavlova.parsers.ArrayParser(Pavlova(), 'i')
+
+        value = parser.parse_input(['1', 2], array, tuple())
+        self.assertEqual(value, array('i', [1, 2]))
+
+        existing = array('i', [1, 2])
+        self.assertIs(parser.parse_input(existing, array, tuple()), existing)
+
+    def test_raises_typeerror_for_non_lists(self) -> None:
+        parser: PavlovaParser = pavlova.parsers.ArrayParser(Pavlova())
+
+        with self.assertRaises(TypeError):
+            parser.parse_input('12', array, tuple())
+
+
+@unittest.skipUnless(numpy, 'NumPy is not installed')
+class TestNdarrayParser(unittest.TestCase):
+    def test_parses_ndarray(self) -> None:
+        parser: PavlovaParser = pavlova.parsers.NdarrayParser(Pavlova(), 'f8')
+
+        value = parser.parse_input([1, 2.5], numpy.ndarray, tuple())
+        self.assertEqual(value.dtype, numpy.dtype('f8'))
+        self.assertEqual(value.tolist(), [1.0, 2.5])
+
+
 class TestStringParser(unittest.TestCase):
     def test_returns_string(self) -> None:
         parser: PavlovaParser = pavlova.parsers.StringParser(Pavlova())
@@ -111,6 +186,85 @@ class TestDatetimeParser(unittest.TestCase):
         self.assertEqual(value.strftime('%z'), '+0300')
 
 
+    def test_parses_epoch_timestamp(self) -> None:
+        parser: PavlovaParser = pavlova.parsers.DatetimeParser(Pavlova())
+
+        self.assertEqual(
+            parser.parse_input(1514764800, datetime, tuple()),
+            datetime(2018, 1, 1, tzinfo=timezone.utc),
+        )
+
+    def test_out_of_range_timestamp(self) -> None:
+        parser: PavlovaParser = pavlova.parsers.DatetimeParser(Pavlova())
+
+        for value in (1e20, 10 ** 30, float('inf')):
+            with self.assertRaises(ValueError):
+                parser.parse_input(value, datetime, tuple())
+
+        @dataclass
+        class Event:
+            at: datetime
+
+        with self.assertRaises(PavlovaParsingError) as raised:
+            Pavlova().from_mapping({'at': 1e20}, Event)
+        self.assertEqual(raised.exception.path, ('at',))
+
+    def test_fast_mode_falls_back_to_dateparser(self) -> None:
+        parser: PavlovaParser = pavlova.parsers.DatetimeParser(Pavlova())
+
+        self.assertEqual(
+            parser.parse_input('1 January 2018', datetime, tuple()),
+            datetime(2018, 1, 1),
+        )
+        self.assertEqual(
+            parser.parse_input('2018/01/02', datetime, tuple()),
+            datetime(2018, 1, 2),
+        )
+
+    def test_strict_mode_rejects_non_iso_strings(self) -> None:
+        parser: PavlovaParser = pavlova.parsers.DatetimeParser(
+            Pavlova(), pavlova.parsers.DatetimeMode.STRICT,
+        )
+
+        self.assertEqual(
+            parser.parse_input('2018-01-02T03:10:11Z', datetime, tuple()),
+            datetime(2018, 1, 2, 3, 10, 11, tzinfo=timezone.utc),
+        )
+        with self.assertRaises(ValueError):
+            parser.parse_input('1 January 2018', datetime, tuple())
+        with self.assertRaises(TypeError):
+            parser.parse_input([], datetime, tuple())
+
+    def test_fuzzy_mode_uses_dateparser(self) -> None:
+        parser: PavlovaParser = pavlova.parsers.DatetimeParser(
+            Pavlova(), pavlova.parsers.DatetimeMode.FUZZY,
+        )
+
+        self.assertEqual(
+            parser.parse_input('2018-01-01', datetime, tuple()),
+            datetime(2018, 1, 1),
+        )
+        with self.assertRaises(TypeError):
+            parser.parse_input(1514764800, datetime, tuple())
+
+
+    def test_fuzzy_cache_is_keyed_by_date(self) -> None:
+        parser = pavlova.parsers.DatetimeParser(
+            Pavlova(), pavlova.parsers.DatetimeMode.FUZZY,
+        )
+
+        with mock.patch('pavlova.parsers.datetime') as mock_datetime:
+            mock_datetime.date.today.side_effect = [
+                date(2026, 12, 31), date(2026, 12, 31), date(2027, 1, 1),
+            ]
+            for _ in range(3):
+                parser.parse_input('10:00', datetime, tuple())
+
+        # pylint: disable=protected-access
+        cache_info = parser._parse_fuzzy_cached.cache_info()
+        self.assertEqual((cache_info.hits, cache_info.misses), (1, 2))
+
+
 class TestUnionParser(unittest.TestCase):
     def test_raises_typeerror_for_unions(self) -> None:
         parser: PavlovaParser = pavlova.parsers.UnionParser(Pavlova())
@@ -235,6 +389,40 @@ class TestEnumParser(unittest.TestCase):
         )
 
 
+    def test_name_takes_precedence_over_value(self) -> None:
+        class Swapped(Enum):
+            RED = 'green'
+            GREEN = 'red'
+
+        parser: PavlovaParser = pavlova.parsers.EnumParser(Pavlova())
+
+        self.assertEqual(
+            parser.parse_input('red', Swapped, tuple()), Swapped.RED
+        )
+        self.assertEqual(
+            parser.parse_input('GREEN', Swapped, tuple()), Swapped.GREEN
+        )
+
+    def test_invalid_value_raises_valueerror(self) -> None:
+        parser: PavlovaParser = pavlova.parsers.EnumParser(Pavlova())
+
+        with self.assertRaises(ValueError):
+            parser.parse_input('purple', SampleEnum, tuple())
+        with self.assertRaises(ValueError):
+            parser.parse_input([], SampleEnum, tuple())
+
+    def test_case_sensitive(self) -> None:
+        parser: PavlovaParser = pavlova.parsers.EnumParser(
+            Pavlova(), case_sensitive=True,
+        )
+
+        self.assertEqual(
+            parser.parse_input('RED', SampleEnum, tuple()), SampleEnum.RED
+        )
+        with self.assertRaises(ValueError):
+            parser.parse_input('red', SampleEnum, tuple())
+
+
 class TestGenericParser(unittest.TestCase):
     def test_calls_generic_type(self) -> None:
 
@@ -246,3 +434,51 @@ class TestGenericParser(unittest.TestCase):
 
         with self.assertRaises(ValueError):
             parser.parse_input('chris', Email, tuple())
+
+
+class TestInterningParser(unittest.TestCase):
+    def test_shares_equal_values(self) -> None:
+        instance = Pavlova()
+        parser = pavlova.parsers.InterningParser(
+            instance, pavlova.parsers.StringParser(instance),
+        )
+
+        first = parser.parse_input(''.join(['A', 'UD']), str, tuple())
+        second = parser.parse_input(''.join(['AU', 'D']), str, tuple())
+        self.assertIs(first, second)
+
+    def test_keeps_exact_decimals(self) -> None:
+        instance = Pavlova()
+        parser = pavlova.parsers.InterningParser(
+            instance, pavlova.parsers.DecimalParser(instance),
+        )
+
+        first = parser.parse_input('1.0', Decimal, tuple())
+        self.assertIs(parser.parse_input('1.0', Decimal, tuple()), first)
+        self.assertEqual(
+            str(parser.parse_input('1', Decimal, tuple())), '1',
+        )
+
+    def test_shares_list_items(self) -> None:
+        instance = Pavlova()
+        parser = pavlova.parsers.InterningParser(
+            instance, pavlova.parsers.ListParser(instance),
+        )
+
+        first = parser.parse_input([1000, 'a'], List[str], tuple())
+        second = parser.parse_input([1000, 'b'], List[str], tuple())
+        self.assertIs(first[0], second[0])
+
+    def test_maxsize(self) -> None:
+        instance = Pavlova()
+        parser = pavlova.parsers.InterningParser(
+            instance, pavlova.parsers.IntParser(instance), maxsize=1,
+        )
+
+        parser.parse_input('1000', int, tuple())
+        parser.parse_input('2000', int, tuple())
+        self.assertEqual(len(parser.table), 1)
+        self.assertIsNot(
+            parser.parse_input('2000', int, tuple()),
+            parser.parse_input('2000', int, tuple()),
+        )
@@ -1,15 +1,29 @@
-# pylint: disable=missing-docstring
+# pylint: disable=missing-docstring,too-few-public-methods
+# pylint: disable=too-many-public-methods
 
 from datetime import datetime
 from decimal import Decimal
 from enum import Enum, auto
+import asyncio
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+import concurrent.futures
+import io
+import json
+import os
+import pickle
+import subprocess
+import sys
+import tempfile
+import threading
 import unittest
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set, Tuple, Type
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
-from pavlova import Pavlova, PavlovaParsingError
-from pavlova.parsers import GenericParser
+from pavlova import INTERN, UNSET, Pavlova, PavlovaParsingError
+from pavlova.decoders import UNTYPED, JsonDecoder
+from pavlova.parsers import GenericParser, IntParser
+from pavlova.serializers import IdentitySerializer
 from tests import Email
 
 
@@ -106,6 +120,40 @@ class TestPavlova(unittest.TestCase):
         self.assertTrue(isinstance(exc.original_exception, TypeError))
         self.assertEqual(exc.path, ('value',))
 
+    def test_nested_error_paths(self) -> None:
+        @dataclass
+        class Nested:
+            items: List[NestedSample]
+            grid: List[List[NestedSample]]
+            mapping: Dict[str, NestedSample]
+
+        valid = {
+            'items': [{'key': 'a'}],
+            'grid': [[{'key': 'a'}]],
+            'mapping': {'a': {'key': 'a'}},
+        }
+        cases = (
+            ({'items': [{'key': 'a'}, {}]}, ('items', '[1]', 'key')),
+            (
+                {'grid': [[], [{'key': 'a'}, {}]]},
+                ('grid', '[1]', '[1]', 'key'),
+            ),
+            (
+                {'mapping': {'a': {'key': 'a'}, 'b': {}}},
+                ('mapping', 'b', 'key'),
+            ),
+        )
+
+        pavlova = Pavlova()
+        for invalid, path in cases:
+            with self.assertRaises(PavlovaParsingError) as raised:
+                pavlova.from_mapping({**valid, **invalid}, Nested)
+            self.assertEqual(raised.exception.path, path)
+
+            with self.assertRaises(PavlovaParsingError) as raised:
+                pavlova.from_mapping({**valid, **invalid}, Nested, ('root',))
+            self.assertEqual(raised.exception.path, ('root',) + path)
+
     def test_missing_value_causes_error(self) -> None:
         pavlova = Pavlova()
         with self.assertRaises(PavlovaParsingError) as raised:
@@ -140,3 +188,748 @@ class TestPavlova(unittest.TestCase):
 
         self.assertTrue(isinstance(parsed, Nested))
         self.assertIsNone(parsed.nested)
+
+    def test_reuses_compiled_plan(self) -> None:
+        # pylint: disable=protected-access
+        pavlova = Pavlova()
+        pavlova.from_mapping({'value': [1]}, SimpleSample)
+        plan = pavlova._snapshot.plans[SimpleSample]
+
+        parsed = pavlova.from_mapping(
+            {'value': ['2'], 'test': 3}, SimpleSample,
+        )
+        self.assertIs(pavlova._snapshot.plans[SimpleSample], plan)
+        self.assertEqual(parsed, SimpleSample(value=[2], test='3'))
+
+    def test_register_parser_invalidates_plan(self) -> None:
+        @dataclass
+        class Example:
+            email: str
+
+        pavlova = Pavlova()
+        pavlova.from_mapping({'email': 'chris'}, Example)
+
+        pavlova.register_parser(str, GenericParser(pavlova, Email))
+        with self.assertRaises(PavlovaParsingError):
+            pavlova.from_mapping({'email': 'chris'}, Example)
+
+    def test_unsupported_type_only_fails_when_present(self) -> None:
+        @dataclass
+        class Example:
+            value: int
+            unsupported: object = None
+
+        pavlova = Pavlova()
+        self.assertEqual(
+            pavlova.from_mapping({'value': 1}, Example),
+            Example(value=1),
+        )
+        with self.assertRaises(PavlovaParsingError) as raised:
+            pavlova.from_mapping({'value': 1, 'unsupported': 1}, Example)
+        self.assertEqual(raised.exception.path, ('unsupported',))
+
+    def test_register_parser_invalidates_resolved_types(self) -> None:
+        class Name(str):
+            pass
+
+        pavlova = Pavlova()
+        self.assertEqual(pavlova.parse_field('chris', Name, tuple()), 'chris')
+
+        pavlova.register_parser(Name, GenericParser(pavlova, Email))
+        with self.assertRaises(ValueError):
+            pavlova.parse_field('chris', Name, tuple())
+
+    def test_registry_is_read_only(self) -> None:
+        pavlova = Pavlova()
+        parsers = pavlova.parsers
+        with self.assertRaises(TypeError):
+            parsers[Email] = GenericParser(pavlova, Email)  # type: ignore
+
+        pavlova.register_parser(Email, GenericParser(pavlova, Email))
+        self.assertIn(Email, pavlova.parsers)
+        self.assertNotIn(Email, parsers)
+
+    def test_parse_while_registering_from_threads(self) -> None:
+        pavlova = Pavlova()
+        records = [{'value': [i], 'test': str(i)} for i in range(200)]
+        classes = [type(f'Name{i}', (str,), {}) for i in range(20)]
+
+        def register() -> None:
+            for name_class in classes:
+                pavlova.register_parser(
+                    name_class, GenericParser(pavlova, name_class),
+                )
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            registered = executor.submit(register)
+            results = [
+                executor.submit(pavlova.from_mappings, records, SimpleSample)
+                for _ in range(3)
+            ]
+            registered.result()
+            for result in results:
+                self.assertEqual(result.result(), [
+                    SimpleSample([i], str(i)) for i in range(200)
+                ])
+        self.assertTrue(all(c in pavlova.parsers for c in classes))
+
+    def test_trace_waits_for_register(self) -> None:
+        # trace replaces the snapshot, so it must not run while a parser is
+        # being registered, or the parser would be lost
+        pavlova = Pavlova()
+
+        def trace() -> None:
+            with pavlova.trace():
+                pass
+
+        # pylint: disable=protected-access
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            with pavlova._register_lock:
+                traced = executor.submit(trace)
+                with self.assertRaises(concurrent.futures.TimeoutError):
+                    traced.result(timeout=0.1)
+            traced.result()
+
+    def test_from_mappings(self) -> None:
+        pavlova = Pavlova()
+        parsed = pavlova.from_mappings(
+            [{'value': [1]}, {'value': ['2'], 'test': 'a'}], SimpleSample,
+        )
+
+        self.assertEqual(parsed, [
+            SimpleSample(value=[1]),
+            SimpleSample(value=[2], test='a'),
+        ])
+
+    def test_from_mappings_error_includes_index(self) -> None:
+        pavlova = Pavlova()
+        with self.assertRaises(PavlovaParsingError) as raised:
+            pavlova.from_mappings(
+                [{'value': [1]}, {'value': [2]}, {}], SimpleSample,
+            )
+
+        self.assertEqual(raised.exception.path, ('[2]', 'value'))
+
+    def test_from_mappings_with_workers(self) -> None:
+        pavlova = Pavlova()
+        pavlova.register_parser(str, GenericParser(pavlova, Email))
+        records = [
+            {'value': [i], 'test': f'{i}@example.com'} for i in range(10)
+        ]
+
+        parsed = pavlova.from_mappings(
+            records, SimpleSample, workers=2, chunk_size=3,
+        )
+        self.assertEqual(parsed, [
+            SimpleSample(value=[i], test=f'{i}@example.com')
+            for i in range(10)
+        ])
+
+        records[7]['test'] = 'invalid'
+        with self.assertRaises(PavlovaParsingError) as raised:
+            pavlova.from_mappings(
+                records, SimpleSample, workers=2, chunk_size=3,
+            )
+        self.assertEqual(raised.exception.path, ('[7]', 'test'))
+        self.assertIsInstance(
+            raised.exception.original_exception, ValueError,
+        )
+
+    def test_iter_from_mappings_is_lazy(self) -> None:
+        pavlova = Pavlova()
+        parsed = pavlova.iter_from_mappings(
+            [{'value': [1]}, {'value': 'bob'}], SimpleSample,
+        )
+
+        self.assertEqual(next(parsed), SimpleSample(value=[1]))
+        with self.assertRaises(PavlovaParsingError) as raised:
+            next(parsed)
+        self.assertEqual(raised.exception.path, ('[1]', 'value'))
+
+    def test_iter_from_mappings_checks_model_class(self) -> None:
+        with self.assertRaises(TypeError):
+            Pavlova().iter_from_mappings([], dict)
+
+    def test_warmup_compiles_nested_plans(self) -> None:
+        @dataclass
+        class Nested:
+            samples: List[Optional[NestedSample]]
+
+        pavlova = Pavlova()
+        pavlova.warmup(Nested)
+
+        plans = pavlova._snapshot.plans  # pylint: disable=protected-access
+        self.assertIn(Nested, plans)
+        self.assertIn(NestedSample, plans)
+
+    def test_warmup_requires_dataclass(self) -> None:
+        with self.assertRaises(TypeError):
+            Pavlova().warmup(dict)
+
+
+class TestToMapping(unittest.TestCase):
+    sample = Sample(
+        enabled=True,
+        date=datetime(2018, 6, 1, 12, 30),
+        portion=0.5,
+        count=3,
+        name='cake',
+        price=Decimal('3.50'),
+        data={'flavour': 'passionfruit'},
+        color=SampleEnum.GREEN,
+        locations=['Sydney'],
+        country=None,
+        nested=NestedSample('key'),
+    )
+
+    def test_to_mapping(self) -> None:
+        self.assertEqual(Pavlova().to_mapping(self.sample), {
+            'enabled': True,
+            'date': '2018-06-01T12:30:00',
+            'portion': 0.5,
+            'count': 3,
+            'name': 'cake',
+            'price': '3.50',
+            'data': {'flavour': 'passionfruit'},
+            'color': 'GREEN',
+            'locations': ['Sydney'],
+            'country': None,
+            'nested': {'key': 'key'},
+        })
+
+    def test_round_trip(self) -> None:
+        pavlova = Pavlova()
+        self.assertEqual(
+            pavlova.from_mapping(pavlova.to_mapping(self.sample), Sample),
+            self.sample,
+        )
+
+    def test_to_mappings(self) -> None:
+        pavlova = Pavlova()
+        self.assertEqual(
+            pavlova.to_mappings([NestedSample('a'), NestedSample('b')]),
+            [{'key': 'a'}, {'key': 'b'}],
+        )
+
+    def test_does_not_share_lists(self) -> None:
+        sample = SimpleSample([1, 2])
+        mapping = Pavlova().to_mapping(sample)
+        self.assertEqual(mapping, {'value': [1, 2], 'test': None})
+        self.assertIsNot(mapping['value'], sample.value)
+
+    def test_requires_dataclass(self) -> None:
+        with self.assertRaises(TypeError):
+            Pavlova().to_mapping({'key': 'value'})
+
+    def test_register_serializer_invalidates_plan(self) -> None:
+        pavlova = Pavlova()
+        self.assertEqual(pavlova.to_mapping(NestedSample('a')), {'key': 'a'})
+
+        class UpperSerializer(IdentitySerializer):
+            def serialize(self, value: Any, field_type: Type) -> Any:
+                return value.upper()
+
+        pavlova.register_serializer(str, UpperSerializer(pavlova))
+        self.assertEqual(pavlova.to_mapping(NestedSample('a')), {'key': 'A'})
+
+
+class TestLazy(unittest.TestCase):
+    def test_parses_fields_when_read(self) -> None:
+        pavlova = Pavlova()
+        calls = []
+
+        class RecordingParser(IntParser):
+            def parse_input(self,
+                            input_value: Any,
+                            field_type: Type,
+                            path: Tuple[str, ...]) -> int:
+                calls.append(input_value)
+                return super().parse_input(input_value, field_type, path)
+
+        pavlova.register_parser(int, RecordingParser(pavlova))
+        parsed = pavlova.lazy_from_mapping(
+            {'value': ['1', '2'], 'test': 'a'}, SimpleSample,
+        )
+        self.assertIsInstance(parsed, SimpleSample)
+        self.assertEqual(calls, [])
+
+        self.assertEqual(parsed.value, [1, 2])
+        self.assertEqual(parsed.value, [1, 2])
+        self.assertEqual(calls, ['1', '2'])
+        self.assertEqual(parsed, SimpleSample([1, 2], 'a'))
+        self.assertEqual(SimpleSample([1, 2], 'a'), parsed)
+
+    def test_defaults(self) -> None:
+        parsed = Pavlova().lazy_from_mapping({'value': []}, SimpleSample)
+        self.assertIsNone(parsed.test)
+
+    def test_missing_field_raises_straight_away(self) -> None:
+        with self.assertRaises(PavlovaParsingError) as raised:
+            Pavlova().lazy_from_mapping({'test': 'a'}, SimpleSample)
+        self.assertEqual(raised.exception.path, ('value',))
+
+    def test_error_paths(self) -> None:
+        @dataclass
+        class Outer:
+            inner: SimpleSample
+
+        parsed = Pavlova().lazy_from_mapping(
+            {'inner': {'value': 'one'}}, Outer,
+        )
+        inner = parsed.inner
+        self.assertIsInstance(inner, SimpleSample)
+        with self.assertRaises(PavlovaParsingError) as raised:
+            inner.value  # pylint: disable=pointless-statement
+        self.assertEqual(raised.exception.path, ('inner', 'value'))
+
+        parsed = Pavlova().lazy_from_mapping({'inner': {}}, Outer)
+        with self.assertRaises(PavlovaParsingError) as raised:
+            parsed.inner  # pylint: disable=pointless-statement
+        self.assertEqual(raised.exception.path, ('inner', 'value'))
+
+    def test_frozen_dataclass(self) -> None:
+        @dataclass(frozen=True)
+        class Frozen:
+            count: int
+
+        parsed = Pavlova().lazy_from_mapping({'count': '3'}, Frozen)
+        self.assertEqual(parsed.count, 3)
+        self.assertEqual(hash(parsed), hash(Frozen(3)))
+
+    def test_pickle(self) -> None:
+        parsed = Pavlova().lazy_from_mapping({
+            'id': '1',
+            'lines': [{'sku': 'a', 'quantity': '2'}],
+            'gift': {'sku': 'b', 'quantity': '1'},
+            'by_warehouse': {},
+        }, Order)
+        unpickled = pickle.loads(pickle.dumps(parsed))
+
+        self.assertIs(type(unpickled), Order)
+        self.assertEqual(unpickled, parsed)
+        # The nested dataclass is lazy as well
+        self.assertIs(type(unpickled.gift), Line)
+        self.assertEqual(unpickled.gift, Line('b', 1))
+
+    def test_repr(self) -> None:
+        parsed = Pavlova().lazy_from_mapping({'value': ['1']}, SimpleSample)
+        self.assertEqual(repr(parsed), repr(SimpleSample([1])))
+
+
+@dataclass
+class Line:
+    sku: str
+    quantity: int
+    note: str = ''
+
+
+@dataclass
+class Order:
+    id: int
+    lines: List[Line]
+    gift: Optional[Line]
+    by_warehouse: Dict[str, Line]
+
+
+class TestProjection(unittest.TestCase):
+    order = {
+        'id': '1',
+        'lines': [{'sku': 'a', 'quantity': 'two'}],
+        'gift': None,
+        'by_warehouse': {'sydney': {'sku': 'b', 'quantity': '2'}},
+    }
+
+    def test_only(self) -> None:
+        parsed = Pavlova().from_mapping(self.order, Order, only={'id'})
+        self.assertEqual(parsed, Order(1, UNSET, UNSET, UNSET))
+
+    def test_only_nested(self) -> None:
+        parsed = Pavlova().from_mapping(self.order, Order, only={
+            'id': ...,
+            'lines': {'sku'},
+            'by_warehouse': {'quantity'},
+        })
+        self.assertEqual(parsed, Order(
+            1,
+            [Line('a', UNSET)],
+            UNSET,
+            {'sydney': Line(UNSET, 2)},
+        ))
+
+    def test_exclude(self) -> None:
+        parsed = Pavlova().from_mapping(self.order, Order, exclude={
+            'lines': {'quantity'},
+            'by_warehouse': ...,
+        })
+        self.assertEqual(parsed, Order(1, [Line('a', UNSET)], None, UNSET))
+
+    def test_errors_include_path(self) -> None:
+        with self.assertRaises(PavlovaParsingError) as raised:
+            Pavlova().from_mapping(self.order, Order, only={'lines'})
+        self.assertEqual(raised.exception.path, ('lines', '[0]', 'quantity'))
+
+    def test_invalid_projections(self) -> None:
+        pavlova = Pavlova()
+        with self.assertRaises(ValueError):
+            pavlova.from_mapping(self.order, Order, only={'missing'})
+        with self.assertRaises(ValueError):
+            pavlova.from_mapping(self.order, Order, only={'id': {'value'}})
+        with self.assertRaises(ValueError):
+            pavlova.from_mapping(
+                self.order, Order, only={'id'}, exclude={'lines'},
+            )
+        with self.assertRaises(TypeError):
+            pavlova.from_mapping(self.order, Order, only='id')
+
+
+class TestTrusted(unittest.TestCase):
+    def test_reuses_correctly_typed_values(self) -> None:
+        @dataclass
+        class Example:
+            name: str
+            price: Decimal
+            color: SampleEnum
+            nested: NestedSample
+            values: List[int]
+            data: Dict[str, int]
+
+        input_mapping = {
+            'name': 'Bob',
+            'price': Decimal('10.01'),
+            'color': SampleEnum.RED,
+            'nested': NestedSample(key='locked'),
+            'values': [1, 2],
+            'data': {'a': 1},
+        }
+
+        parsed = Pavlova(trusted=True).from_mapping(input_mapping, Example)
+        for name, value in input_mapping.items():
+            self.assertIs(getattr(parsed, name), value)
+
+    def test_parses_incorrectly_typed_values(self) -> None:
+        @dataclass
+        class Example:
+            count: int
+            values: List[int]
+            data: Dict[str, int]
+            nested: NestedSample
+
+        input_mapping = {
+            'count': '1',
+            'values': [1, '2'],
+            'data': {'a': '1'},
+            'nested': {'key': 'locked'},
+        }
+
+        parsed = Pavlova(trusted=True).from_mapping(input_mapping, Example)
+        self.assertEqual(parsed, Example(
+            count=1,
+            values=[1, 2],
+            data={'a': 1},
+            nested=NestedSample(key='locked'),
+        ))
+
+    def test_untrusted_copies_values(self) -> None:
+        input_mapping = {'value': [1, 2]}
+
+        parsed = Pavlova().from_mapping(input_mapping, SimpleSample)
+        self.assertEqual(parsed.value, input_mapping['value'])
+        self.assertIsNot(parsed.value, input_mapping['value'])
+
+
+class TestIntern(unittest.TestCase):
+    def test_interns_marked_fields(self) -> None:
+        @dataclass
+        class Example:
+            code: str = field(metadata={INTERN: True})
+            tags: List[str] = field(metadata={INTERN: True})
+            name: str = ''
+
+        pavlova = Pavlova()
+        records = pavlova.from_mappings([
+            {'code': 1000, 'tags': [2000], 'name': 3000},
+            {'code': 1000, 'tags': [2000], 'name': 3000},
+        ], Example)
+
+        self.assertEqual(records[0], Example('1000', ['2000'], '3000'))
+        self.assertIs(records[0].code, records[1].code)
+        self.assertIs(records[0].tags[0], records[1].tags[0])
+        self.assertIsNot(records[0].name, records[1].name)
+
+
+class TestAsync(unittest.TestCase):
+    def setUp(self) -> None:
+        self.loop = asyncio.new_event_loop()
+        self.executor = ThreadPoolExecutor(max_workers=1)
+        self.pavlova = Pavlova()
+        self.pavlova.async_executor = self.executor
+        self.pavlova.async_offload_threshold = 10
+        self.pavlova.async_chunk_size = 2
+
+    def tearDown(self) -> None:
+        self.loop.close()
+        self.executor.shutdown()
+
+    def test_afrom_mapping(self) -> None:
+        threads: Set[threading.Thread] = set()
+
+        class RecordingParser(IntParser):
+            def parse_input(self,
+                            input_value: Any,
+                            field_type: Type,
+                            path: Tuple[str, ...]) -> int:
+                threads.add(threading.current_thread())
+                return super().parse_input(input_value, field_type, path)
+
+        self.pavlova.register_parser(int, RecordingParser(self.pavlova))
+
+        small = self.loop.run_until_complete(
+            self.pavlova.afrom_mapping({'value': [1]}, SimpleSample)
+        )
+        self.assertEqual(small, SimpleSample(value=[1]))
+        self.assertEqual(threads, {threading.current_thread()})
+
+        threads.clear()
+        large = self.loop.run_until_complete(self.pavlova.afrom_mapping(
+            {'value': list(range(20))}, SimpleSample,
+        ))
+        self.assertEqual(large, SimpleSample(value=list(range(20))))
+        self.assertNotIn(threading.current_thread(), threads)
+
+    def test_afrom_mapping_raises_error(self) -> None:
+        with self.assertRaises(PavlovaParsingError) as raised:
+            self.loop.run_until_complete(self.pavlova.afrom_mapping(
+                {'value': ['bob'] * 20}, SimpleSample,
+            ))
+        self.assertEqual(raised.exception.path, ('value',))
+
+    def test_afrom_mappings(self) -> None:
+        records = [{'value': [i]} for i in range(5)]
+        records.append({'value': list(range(20))})
+        records.append({'value': [6]})
+
+        parsed = self.loop.run_until_complete(
+            self.pavlova.afrom_mappings(records, SimpleSample)
+        )
+        self.assertEqual(parsed, [
+            SimpleSample(value=record['value']) for record in records
+        ])
+
+    def test_afrom_mappings_error_includes_index(self) -> None:
+        records = [{'value': [i]} for i in range(5)]
+        records.append({'value': list(range(20)) + ['bob']})
+
+        with self.assertRaises(PavlovaParsingError) as raised:
+            self.loop.run_until_complete(
+                self.pavlova.afrom_mappings(records, SimpleSample)
+            )
+        self.assertEqual(raised.exception.path, ('[5]', 'value'))
+
+
+    def test_process_pool_executor(self) -> None:
+        with ProcessPoolExecutor(max_workers=1) as executor:
+            self.pavlova.async_executor = executor
+            large = self.loop.run_until_complete(self.pavlova.afrom_mapping(
+                {'value': list(range(20))}, SimpleSample,
+            ))
+            records = [{'value': list(range(20))}, {'value': [1]}]
+            parsed = self.loop.run_until_complete(
+                self.pavlova.afrom_mappings(records, SimpleSample)
+            )
+
+        self.assertEqual(large, SimpleSample(value=list(range(20))))
+        self.assertEqual(parsed, [
+            SimpleSample(value=list(range(20))), SimpleSample(value=[1]),
+        ])
+        self.assertIs(self.pavlova.async_executor, executor)
+
+
+class TestIterJsonl(unittest.TestCase):
+    LINES = (
+        b'{"value": [1]}\n'
+        b'\n'
+        b'{"value": ["2"], "test": "a"}\n'
+        b'{"value": "bob"}\n'
+        b'not json\n'
+        b'[1]\n'
+        b'{"value": [3]}'
+    )
+    VALID = [
+        SimpleSample(value=[1]),
+        SimpleSample(value=[2], test='a'),
+        SimpleSample(value=[3]),
+    ]
+
+    def setUp(self) -> None:
+        handle, self.path = tempfile.mkstemp(suffix='.jsonl')
+        with os.fdopen(handle, 'wb') as file:
+            file.write(self.LINES)
+
+    def tearDown(self) -> None:
+        os.remove(self.path)
+
+    def test_uses_json_decoder(self) -> None:
+        lines: List[Any] = []
+
+        def loads(data: Any) -> Any:
+            lines.append(data)
+            return json.loads(data)
+
+        pavlova = Pavlova()
+        pavlova.json_decoder = JsonDecoder(loads)
+        parsed = pavlova.iter_jsonl(self.path, SimpleSample, skip_invalid=True)
+        self.assertEqual(list(parsed), self.VALID)
+        self.assertEqual(len(lines), 6)
+
+    def test_skip_invalid(self) -> None:
+        pavlova = Pavlova()
+
+        for use_mmap in (False, True):
+            parsed = pavlova.iter_jsonl(
+                self.path, SimpleSample, skip_invalid=True, use_mmap=use_mmap,
+            )
+            self.assertEqual(list(parsed), self.VALID)
+
+    def test_reads_open_files(self) -> None:
+        pavlova = Pavlova()
+
+        for file in (io.BytesIO(self.LINES),
+                     io.StringIO(self.LINES.decode())):
+            parsed = pavlova.iter_jsonl(file, SimpleSample, skip_invalid=True)
+            self.assertEqual(list(parsed), self.VALID)
+
+    def test_error_includes_line_number(self) -> None:
+        pavlova = Pavlova()
+        parsed = pavlova.iter_jsonl(self.path, SimpleSample)
+
+        self.assertEqual(next(parsed), self.VALID[0])
+        self.assertEqual(next(parsed), self.VALID[1])
+        with self.assertRaises(PavlovaParsingError) as raised:
+            next(parsed)
+        self.assertEqual(raised.exception.path, ('line 4', 'value'))
+
+    def test_invalid_json_raises_error(self) -> None:
+        pavlova = Pavlova()
+
+        for line, error in ((b'not json', ValueError), (b'[1]', TypeError)):
+            with self.assertRaises(PavlovaParsingError) as raised:
+                list(pavlova.iter_jsonl(io.BytesIO(line), SimpleSample))
+            self.assertEqual(raised.exception.path, ('line 1',))
+            self.assertIsInstance(raised.exception.original_exception, error)
+
+    def test_empty_file(self) -> None:
+        with open(self.path, 'wb'):
+            pass
+
+        parsed = Pavlova().iter_jsonl(self.path, SimpleSample, use_mmap=True)
+        self.assertEqual(list(parsed), [])
+
+
+class TypedDecoder(JsonDecoder):
+    "Decodes documents straight into SimpleSample, if they have no test"
+
+    def decode_typed(self, data: Any, model_type: Type) -> Any:
+        decoded = self.decode(data)
+        if model_type is not SimpleSample or 'test' in decoded:
+            return UNTYPED
+        return SimpleSample(['typed'])  # type: ignore
+
+
+class TestFromJson(unittest.TestCase):
+    def test_from_json(self) -> None:
+        pavlova = Pavlova()
+        data = b'{"value": [1, "2"], "test": "a"}'
+        for document in (data, data.decode(), memoryview(data)):
+            self.assertEqual(
+                pavlova.from_json(document, SimpleSample),
+                SimpleSample([1, 2], 'a'),
+            )
+
+    def test_invalid_documents(self) -> None:
+        pavlova = Pavlova()
+        with self.assertRaises(ValueError):
+            pavlova.from_json(b'{"value": ', SimpleSample)
+        with self.assertRaises(TypeError):
+            pavlova.from_json(b'[]', SimpleSample)
+        with self.assertRaises(PavlovaParsingError) as context:
+            pavlova.from_json(b'{"value": ["a"]}', SimpleSample)
+        self.assertEqual(context.exception.path, ('value',))
+
+    def test_from_json_array(self) -> None:
+        pavlova = Pavlova()
+        self.assertEqual(
+            pavlova.from_json_array(
+                b'[{"value": [1]}, {"value": [2]}]', SimpleSample,
+            ),
+            [SimpleSample([1]), SimpleSample([2])],
+        )
+        with self.assertRaises(PavlovaParsingError) as context:
+            pavlova.from_json_array(
+                b'[{"value": [1]}, {"value": ["a"]}]', SimpleSample,
+            )
+        self.assertEqual(context.exception.path, ('[1]', 'value'))
+        with self.assertRaises(TypeError):
+            pavlova.from_json_array(b'{"value": [1]}', SimpleSample)
+        with self.assertRaises(TypeError):
+            pavlova.from_json_array(b'[1]', SimpleSample)
+
+    def test_custom_decoder(self) -> None:
+        documents: List[Any] = []
+
+        def loads(data: Any) -> Any:
+            documents.append(data)
+            return {'value': [1]}
+
+        pavlova = Pavlova()
+        pavlova.json_decoder = JsonDecoder(loads)
+        self.assertEqual(
+            pavlova.from_json(b'{}', SimpleSample), SimpleSample([1]),
+        )
+        self.assertEqual(documents, [b'{}'])
+
+    def test_typed_decoding_is_only_trusted(self) -> None:
+        data = b'{"value": [1]}'
+        pavlova = Pavlova()
+        pavlova.json_decoder = TypedDecoder()
+        self.assertEqual(
+            pavlova.from_json(data, SimpleSample), SimpleSample([1]),
+        )
+
+        pavlova = Pavlova(trusted=True)
+        pavlova.json_decoder = TypedDecoder()
+        self.assertEqual(
+            pavlova.from_json(data, SimpleSample), SimpleSample(['typed']),
+        )
+        # Documents that the decoder rejects are parsed as usual
+        self.assertEqual(
+            pavlova.from_json(b'{"value": [1], "test": "a"}', SimpleSample),
+            SimpleSample([1], 'a'),
+        )
+
+
+class TestImport(unittest.TestCase):
+    def test_import_is_lazy(self) -> None:
+        # The time taken to import pavlova is measured by the import_pavlova
+        # benchmark, rather than here, where it depends on the machine
+        output = subprocess.check_output([
+            sys.executable, '-c',
+            'import sys\n'
+            'import pavlova\n'
+            'print(sorted(set(sys.modules) & {\n'
+            '    "asyncio", "concurrent.futures", "dateparser", "orjson",\n'
+            '}))\n'
+        ])
+
+        self.assertEqual(output.decode().strip(), '[]')
+
+    def test_warmup_imports_dateparser(self) -> None:
+        output = subprocess.check_output([
+            sys.executable, '-c',
+            'import sys\n'
+            'from tests.test_pavlova import Sample\n'
+            'from pavlova import Pavlova\n'
+            'Pavlova().warmup(Sample)\n'
+            'print("dateparser" in sys.modules)\n'
+        ])
+
+        self.assertEqual(output.decode().strip(), 'True')
@@ -0,0 +1,121 @@
+# pylint: disable=missing-docstring
+
+from array import array
+from datetime import datetime, timezone
+from decimal import Decimal
+from enum import Enum
+import unittest
+from typing import Dict, List, Optional, Union
+
+from dataclasses import dataclass
+
+from pavlova import Pavlova
+import pavlova.serializers
+from pavlova.serializers import PavlovaSerializer
+
+
+class Color(Enum):
+    RED = 'red'
+    GREEN = 'green'
+
+
+@dataclass
+class Point:
+    x: int
+    y: int
+
+
+@dataclass
+class Line:
+    start: Point
+    end: Point
+
+
+class TestDatetimeSerializer(unittest.TestCase):
+    def test_serializes_as_iso(self) -> None:
+        serializer: PavlovaSerializer = (
+            pavlova.serializers.DatetimeSerializer(Pavlova())
+        )
+        value = datetime(2018, 6, 1, 12, 30, tzinfo=timezone.utc)
+        self.assertEqual(
+            serializer.serialize(value, datetime),
+            '2018-06-01T12:30:00+00:00',
+        )
+
+
+class TestDecimalSerializer(unittest.TestCase):
+    def test_serializes_as_string(self) -> None:
+        serializer = pavlova.serializers.DecimalSerializer(Pavlova())
+        self.assertEqual(
+            serializer.serialize(Decimal('1.10'), Decimal), '1.10',
+        )
+
+
+class TestEnumSerializer(unittest.TestCase):
+    def test_serializes_name(self) -> None:
+        serializer = pavlova.serializers.EnumSerializer(Pavlova())
+        self.assertEqual(serializer.serialize(Color.RED, Color), 'RED')
+
+    def test_serializes_value(self) -> None:
+        serializer = pavlova.serializers.EnumSerializer(
+            Pavlova(), use_value=True,
+        )
+        self.assertEqual(serializer.serialize(Color.RED, Color), 'red')
+
+
+class TestArraySerializer(unittest.TestCase):
+    def test_serializes_as_list(self) -> None:
+        serializer = pavlova.serializers.ArraySerializer(Pavlova())
+        self.assertEqual(
+            serializer.serialize(array('d', [1.0, 2.5]), array), [1.0, 2.5],
+        )
+
+
+class TestListSerializer(unittest.TestCase):
+    def test_copies_primitive_lists(self) -> None:
+        serializer = pavlova.serializers.ListSerializer(Pavlova())
+        value = [1, 2, 3]
+        result = serializer.serialize(value, List[int])
+        self.assertEqual(result, value)
+        self.assertIsNot(result, value)
+
+    def test_serializes_items(self) -> None:
+        serializer = pavlova.serializers.ListSerializer(Pavlova())
+        self.assertEqual(
+            serializer.serialize([Color.RED, Color.GREEN], List[Color]),
+            ['RED', 'GREEN'],
+        )
+        self.assertEqual(
+            serializer.serialize([Point(1, 2)], List[Point]),
+            [{'x': 1, 'y': 2}],
+        )
+
+
+class TestDictSerializer(unittest.TestCase):
+    def test_serializes_keys_and_values(self) -> None:
+        serializer = pavlova.serializers.DictSerializer(Pavlova())
+        self.assertEqual(
+            serializer.serialize(
+                {'a': Decimal('1.5')}, Dict[str, Decimal],
+            ),
+            {'a': '1.5'},
+        )
+
+
+class TestUnionSerializer(unittest.TestCase):
+    def test_optional(self) -> None:
+        serializer = pavlova.serializers.UnionSerializer(Pavlova())
+        self.assertIsNone(serializer.serialize(None, Optional[Color]))
+        self.assertEqual(
+            serializer.serialize(Color.GREEN, Optional[Color]), 'GREEN',
+        )
+
+    def test_serializes_by_type_of_value(self) -> None:
+        serializer = pavlova.serializers.UnionSerializer(Pavlova())
+        field_type = Union[Point, Line, Decimal]
+        self.assertEqual(
+            serializer.serialize(Point(1, 2), field_type), {'x': 1, 'y': 2},
+        )
+        self.assertEqual(
+            serializer.serialize(Decimal('2'), field_type), '2',
+        )
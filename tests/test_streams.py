@@ -0,0 +1,65 @@
+# pylint: disable=missing-docstring
+
+import io
+import json
+import unittest
+from typing import Any, List
+
+from pavlova.streams import iter_json_array
+
+
+class CountingStream(io.BytesIO):
+    "Records how many bytes have been read"
+
+    def __init__(self, data: bytes) -> None:
+        super().__init__(data)
+        self.bytes_read = 0
+
+    def read(self, size: Any = -1) -> bytes:
+        data = super().read(size)
+        self.bytes_read += len(data)
+        return data
+
+
+class TestIterJsonArray(unittest.TestCase):
+    DOCUMENTS = [
+        '[]',
+        ' [ 1 , -2.5e3 , true , false , null ] ',
+        '["a\\"b\\\\", "\\u00e9", "é😀", "]}"]',
+        '[{"a": [1, {"b": "]}"}], "c": {}}, [[]], 12345678901234567890]',
+    ]
+
+    def test_matches_json_loads(self) -> None:
+        # Every chunk size splits the items at a different point
+        for document in self.DOCUMENTS:
+            for chunk_size in range(1, 10):
+                items: List[Any] = list(iter_json_array(
+                    io.BytesIO(document.encode()), chunk_size,
+                ))
+                self.assertEqual(items, json.loads(document))
+
+    def test_invalid_json(self) -> None:
+        documents = [
+            '', '{}', '[1,', '[1 2]', '[1]x', '[{"a": 1]', '[{"a": 1}',
+            '[{"a": x}]', '["abc', '[tru]', '[}',
+        ]
+        for document in documents:
+            for chunk_size in (1, 3, 64):
+                with self.assertRaises(json.JSONDecodeError):
+                    list(iter_json_array(
+                        io.BytesIO(document.encode()), chunk_size,
+                    ))
+
+    def test_invalid_item_is_reported_straight_away(self) -> None:
+        items = ', '.join(['{"a": 1}'] * 10000)
+        stream = CountingStream(f'[{{"a": nope}}, {items}]'.encode())
+
+        with self.assertRaises(json.JSONDecodeError):
+            list(iter_json_array(stream, 64))
+        self.assertEqual(stream.bytes_read, 64)
+
+    def test_large_item(self) -> None:
+        item = {'values': [{'a': 'b' * 10} for _ in range(10000)]}
+        stream = io.BytesIO(json.dumps([item, item]).encode())
+
+        self.assertEqual(list(iter_json_array(stream, 64)), [item, item])
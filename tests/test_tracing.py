@@ -0,0 +1,56 @@
+# pylint: disable=missing-docstring
+
+import unittest
+from typing import List
+
+from dataclasses import dataclass
+
+from pavlova import Pavlova
+from pavlova.tracing import TracingParser
+
+
+@dataclass
+class Inner:
+    value: int
+
+
+@dataclass
+class Outer:
+    name: str
+    inners: List[Inner]
+
+
+class TestTracing(unittest.TestCase):
+    def test_records_parsers_and_fields(self) -> None:
+        pavlova = Pavlova()
+        with pavlova.trace() as tracer:
+            pavlova.from_mapping(
+                {'name': 'outer', 'inners': [{'value': 1}, {'value': 2}]},
+                Outer,
+            )
+
+        self.assertEqual(tracer.parsers['StringParser'].calls, 1)
+        self.assertEqual(tracer.parsers['ListParser'].calls, 1)
+        self.assertEqual(tracer.parsers['DataclassParser'].calls, 2)
+        self.assertEqual(tracer.parsers['IntParser'].calls, 2)
+        self.assertEqual(tracer.fields['Outer.name'].calls, 1)
+        self.assertEqual(tracer.fields['Outer.inners'].calls, 1)
+        self.assertEqual(tracer.fields['Inner.value'].calls, 2)
+        self.assertGreater(tracer.fields['Outer.inners'].seconds, 0)
+
+        report = tracer.report().splitlines()
+        self.assertTrue(report[0].startswith('parser'))
+        self.assertIn('field', [line.split(' ')[0] for line in report])
+
+    def test_stops_recording_after_context(self) -> None:
+        # pylint: disable=protected-access
+        pavlova = Pavlova()
+        with pavlova.trace() as tracer:
+            pavlova.from_mapping({'value': 1}, Inner)
+        pavlova.from_mapping({'value': 1}, Inner)
+
+        self.assertEqual(tracer.fields['Inner.value'].calls, 1)
+        plan = pavlova._snapshot.plans[Inner]
+        self.assertFalse(any(
+            isinstance(field.parser, TracingParser) for field in plan
+        ))
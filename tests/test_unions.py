@@ -0,0 +1,168 @@
+# pylint: disable=missing-docstring
+
+import unittest
+from typing import List, Optional, Union
+
+from dataclasses import dataclass
+
+from pavlova import Pavlova, PavlovaParsingError
+from pavlova.parsers import TaggedUnionParser
+
+try:
+    from typing import Literal  # pylint: disable=ungrouped-imports
+except ImportError as exc:
+    raise unittest.SkipTest('Literal requires Python 3.8 or higher') from exc
+
+
+@dataclass
+class Cat:
+    kind: Literal['cat']
+    lives: int
+
+
+@dataclass
+class Dog:
+    kind: Literal['dog', 'puppy']
+    good: bool
+
+
+@dataclass
+class Pets:
+    pets: List[Union[Cat, Dog]]
+    favourite: Optional[Union[Cat, Dog]] = None
+
+
+@dataclass
+class Circle:
+    radius: float
+    shape: str = 'circle'
+
+
+@dataclass
+class Square:
+    side: float
+    shape: str = 'square'
+
+
+@dataclass
+class Drawing:
+    shapes: List[Union[Circle, Square]]
+
+
+class TestTaggedUnions(unittest.TestCase):
+    def test_dispatches_on_literal_field(self) -> None:
+        parsed = Pavlova().from_mapping({
+            'pets': [
+                {'kind': 'cat', 'lives': '9'},
+                {'kind': 'dog', 'good': 'yes'},
+                {'kind': 'puppy', 'good': 'yes'},
+            ],
+            'favourite': None,
+        }, Pets)
+
+        self.assertEqual(parsed, Pets(pets=[
+            Cat(kind='cat', lives=9),
+            Dog(kind='dog', good=True),
+            Dog(kind='puppy', good=True),
+        ]))
+
+    def test_optional_tagged_union(self) -> None:
+        parsed = Pavlova().from_mapping({
+            'pets': [],
+            'favourite': {'kind': 'cat', 'lives': 1},
+        }, Pets)
+
+        self.assertEqual(parsed.favourite, Cat(kind='cat', lives=1))
+
+    def test_unknown_tag_raises_error(self) -> None:
+        with self.assertRaises(PavlovaParsingError) as raised:
+            Pavlova().from_mapping({'pets': [{'kind': 'fish'}]}, Pets)
+
+        self.assertEqual(raised.exception.path, ('pets', '[0]', 'kind'))
+        self.assertIsInstance(
+            raised.exception.original_exception, ValueError,
+        )
+
+    def test_unhashable_tag_raises_error(self) -> None:
+        with self.assertRaises(PavlovaParsingError) as raised:
+            Pavlova().from_mapping({'pets': [{'kind': ['cat']}]}, Pets)
+
+        self.assertEqual(raised.exception.path, ('pets', '[0]', 'kind'))
+        self.assertIsInstance(
+            raised.exception.original_exception, ValueError,
+        )
+
+    def test_missing_discriminator_raises_error(self) -> None:
+        with self.assertRaises(PavlovaParsingError) as raised:
+            Pavlova().from_mapping({
+                'pets': [{'kind': 'cat', 'lives': 9}, {'lives': 9}],
+            }, Pets)
+
+        self.assertEqual(raised.exception.path, ('pets', '[1]', 'kind'))
+        self.assertIsInstance(
+            raised.exception.original_exception, TypeError,
+        )
+
+    def test_optional_unknown_tag_raises_error(self) -> None:
+        with self.assertRaises(PavlovaParsingError) as raised:
+            Pavlova().from_mapping({
+                'pets': [], 'favourite': {'kind': 'cow'},
+            }, Pets)
+
+        self.assertEqual(raised.exception.path, ('favourite', 'kind'))
+
+    def test_nested_errors_include_index(self) -> None:
+        with self.assertRaises(PavlovaParsingError) as raised:
+            Pavlova().from_mapping({
+                'pets': [
+                    {'kind': 'cat', 'lives': 9},
+                    {'kind': 'cat', 'lives': 'many'},
+                ],
+            }, Pets)
+
+        self.assertEqual(raised.exception.path, ('pets', '[1]', 'lives'))
+
+    def test_union_without_discriminator_is_not_allowed(self) -> None:
+        with self.assertRaises(PavlovaParsingError) as raised:
+            Pavlova().from_mapping({'shapes': [{'radius': 1}]}, Drawing)
+
+        self.assertIsInstance(
+            raised.exception.original_exception, TypeError,
+        )
+
+    def test_registered_discriminator(self) -> None:
+        pavlova = Pavlova()
+        pavlova.register_parser(
+            Union[Circle, Square], TaggedUnionParser(pavlova, 'shape'),
+        )
+        parsed = pavlova.from_mapping({
+            'shapes': [
+                {'shape': 'circle', 'radius': 1},
+                {'shape': 'square', 'side': 2},
+            ],
+        }, Drawing)
+
+        self.assertEqual(parsed, Drawing(shapes=[Circle(1), Square(2)]))
+
+    def test_registered_tags(self) -> None:
+        pavlova = Pavlova()
+        pavlova.register_parser(
+            Union[Circle, Square],
+            TaggedUnionParser(pavlova, 'type', {1: Circle, 2: Square}),
+        )
+        parsed = pavlova.from_mapping({
+            'shapes': [{'type': 2, 'side': 2}, {'type': 1, 'radius': 1}],
+        }, Drawing)
+
+        self.assertEqual(parsed, Drawing(shapes=[Square(2), Circle(1)]))
+
+
+class TestLiteralParser(unittest.TestCase):
+    def test_parses_literal(self) -> None:
+        pavlova = Pavlova()
+
+        self.assertEqual(
+            pavlova.parse_field('cat', Literal['cat', 'dog'], tuple()), 'cat',
+        )
+        with self.assertRaises(ValueError):
+            pavlova.parse_field('fish', Literal['cat', 'dog'], tuple())